@@ -1,90 +1,291 @@
+import os  # Import os to select the SDL drivers for headless runs.
+import random  # Import random for the seeded generator handed to controllers.
 import sys  # Import the sys module for system-specific parameters and functions.
-from time import sleep  # Import sleep function to create delays.
+import time  # Import time to measure startup.
+
+STARTED = time.perf_counter()  # Taken before the heavy imports below.
 
 import pygame  # Import the pygame module for game development.
 
 # Import custom classes for game settings and functionalities.
 from settings import Settings
-from game_stats import GameStats
+from assets import AssetCache
+from fonts import FontService
+from game_stats import GameStats, PLAYING, RESPAWNING
 from scoreboard import Scoreboard
 from button import Button
 from ship import Ship
-from bullet import Bullet
-from alien import Alien
+from bullet import BulletPool
+from fleet import Fleet
+from collisions import LatticeCollider
+from formation import FormationRenderer
+from renderer import DirtyRenderer
+from scaling import ScaledPresenter
+from profiler import FrameProfiler, StartupTimer
+from replay import InputRecorder
+from leaderboard import Leaderboard
+from telemetry import TelemetryStream
+from savestate import RewindBuffer, restore, snapshot
+
+IMPORTED = time.perf_counter()  # End of the imports phase of startup.
 
 
 class AlienInvasion:
     """Class that handles the overall management of the game assets and behavior."""
 
-    def __init__(self):
-        """Initialize the game and set up resources."""
-        pygame.init()  # Initialize all imported pygame modules.
-        self.settings = Settings()  # Create an instance of the Settings class.
-
-        # Set up the game window in fullscreen mode and get its dimensions.
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.settings.screen_width = self.screen.get_rect().width
-        self.settings.screen_height = self.screen.get_rect().height
+    def __init__(self, headless=False, seed=None, settings=None):
+        """Initialize the game and set up resources.
+
+        A headless game opens no window: it draws to an off-screen surface of
+        the fixed size in Settings, and is driven through run_simulation().
+        A Settings instance may be passed in to replace the defaults.
+        """
+        self.startup = StartupTimer(STARTED, IMPORTED)  # Breakdown of the time to the first frame.
+        self.headless = headless  # True when running without a display.
+        if headless:  # Use SDL's dummy drivers so no window or audio device is opened.
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        # Start only the subsystems the game uses; audio and joysticks stay off.
+        pygame.display.init()
+        pygame.font.init()
+        self.startup.mark('pygame init')
+        self.settings = settings or Settings()  # Use the given settings or the defaults.
+        self.rng = random.Random(seed)  # Seeded randomness for scripted controllers.
+
+        self.presenter = None  # Scales the logical screen to the display, if enabled.
+        if headless:  # Keep the fixed logical resolution from Settings.
+            self.screen = pygame.display.set_mode(
+                (self.settings.screen_width, self.settings.screen_height))
+        elif self.settings.logical_resolution:  # Play at the Settings size on any display.
+            window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.presenter = ScaledPresenter(
+                window, (self.settings.screen_width, self.settings.screen_height),
+                self.settings.scale_mode)
+            self.screen = self.presenter.screen  # Everything draws to the logical surface.
+        else:
+            # Set up the game window in fullscreen mode and get its dimensions.
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.settings.screen_width = self.screen.get_rect().width
+            self.settings.screen_height = self.screen.get_rect().height
         pygame.display.set_caption("Alien Invasion")  # Set the window title.
+        # Keep only the events the game responds to; mouse motion never wakes it up.
+        # Blocking flushes the queue, so this happens before any input can arrive.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                  pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED])
+        self.startup.mark('display')
+        self.clock = pygame.time.Clock()  # Clock that paces rendering and the simulation.
+        self.ticks = 0  # Simulation steps run by run_game, the time base for input logs.
+
+        # Load each image once and share it between all sprites.
+        self.assets = AssetCache(bundle=self.settings.asset_bundle)
+        self.fonts = FontService()  # Shared fonts and rendered text for the HUD and buttons.
+
+        # Keep the top scores on disk; headless runs leave the player's leaderboard alone.
+        self.leaderboard = None
+        if self.settings.leaderboard_path and not headless:
+            self.leaderboard = Leaderboard(self.settings.leaderboard_path,
+                                           self.settings.leaderboard_size)
+        self.startup.mark('leaderboard')
 
         # Create an instance for tracking game statistics and the scoreboard.
         self.stats = GameStats(self)
         self.sb = Scoreboard(self)
+        self.startup.mark('hud')
 
         self.ship = Ship(self)  # Create a ship instance.
-        self.bullets = pygame.sprite.Group()  # Group to manage bullet sprites.
-        self.aliens = pygame.sprite.Group()  # Group to manage alien sprites.
+        self.bullets = BulletPool(self)  # Array-backed storage for every bullet.
+        self.fleet = Fleet(self)  # Array-backed store for the alien fleet.
+        self.aliens = self.fleet.aliens  # Group of living aliens, used for drawing.
+        self.collider = LatticeCollider(self)  # Broadphase for bullet-alien hits.
+        self.formation = FormationRenderer(self)  # Draws the fleet with a single blit.
 
         self._create_fleet()  # Create the fleet of aliens.
+        self.startup.mark('sprites')
 
         # Initialize the Play button.
         self.play_button = Button(self, "Play")
 
-    def run_game(self):
-        """Main loop for the game execution."""
-        while True:  # Infinite loop to keep the game running.
-            self._check_events()  # Check for user events.
+        self.renderer = DirtyRenderer(self)  # Used when settings.dirty_rendering is on.
+
+        self.profiler = FrameProfiler(self)  # Per-phase frame timings; F3 toggles its overlay.
+        if self.settings.profiling:
+            self.profiler.enable(self.settings.profile_log)
+
+        self.recorder = None  # Writes the input stream to settings.record_path, if set.
+        if self.settings.record_path:
+            self.recorder = InputRecorder(self.settings.record_path, self.settings)
 
-            if self.stats.game_active:  # If the game is active.
-                self.ship.update()  # Update the ship's position.
-                self._update_bullets()  # Update bullets.
-                self._update_aliens()  # Update aliens.
+        self.rewind = None  # Recent snapshots for Backspace to rewind to; not used while recording.
+        if self.settings.rewind_memory and self.recorder is None:
+            self.rewind = RewindBuffer(self.settings.rewind_memory)
 
-            self._update_screen()  # Refresh the screen with updated graphics.
+        self.telemetry = None  # Mirrors the game to a spectator dashboard, if set.
+        if self.settings.telemetry_address:
+            self.telemetry = TelemetryStream(self, self.settings.telemetry_address,
+                                             self.settings.telemetry_keyframe_interval)
+        self.startup.mark('tools')
+
+    def run_game(self):
+        """Main loop for the game execution.
+
+        The simulation advances in fixed steps of 1 / tick_rate seconds. Each
+        rendered frame runs as many steps as the elapsed time calls for, so a
+        slow machine draws fewer frames instead of slowing the game down.
+        """
+        dt = 1 / self.settings.tick_rate  # Length of one simulation step.
+        lag = 0.0  # Elapsed time not yet simulated.
+        try:
+            while True:  # Infinite loop to keep the game running.
+                if not self.stats.game_active:  # Menu or game over: wait at low power.
+                    self._run_idle()
+                    self.clock.tick()  # Don't count the wait as frame time.
+                    lag = 0.0
+
+                # Wait for the FPS cap and measure the time since the last frame.
+                frame_time = self.clock.tick(self.settings.fps_cap) / 1000
+                lag += min(frame_time, self.settings.max_frame_time)  # Avoid a catch-up spiral.
+
+                self._check_events()  # Check for user events.
+
+                while lag >= dt:  # Run the steps this frame owes.
+                    if self.stats.game_active:  # If the game is active.
+                        self._step_simulation(dt)
+                    self.ticks += 1
+                    lag -= dt
+                    if self.telemetry is not None:  # Mirror the new tick to spectators.
+                        self.telemetry.send(self.ticks)
+                    if (self.rewind is not None and self.stats.game_active
+                            and self.ticks % self.settings.rewind_interval == 0):
+                        self.rewind.push(snapshot(self))  # Remember where to rewind to.
+
+                self._update_screen()  # Refresh the screen with updated graphics.
+                if self.startup is not None:  # The first frame is on screen.
+                    self._finish_startup()
+
+                if self.profiler.enabled:  # Record the frame's phase timings.
+                    self.profiler.end_frame(frame_time)
+        finally:
+            if self.recorder is not None:  # Finish the input log with the final state.
+                self.recorder.close(self, self.ticks)
+            if self.leaderboard is not None:  # Write any score still pending.
+                self.leaderboard.close()
+            if self.telemetry is not None:
+                self.telemetry.close()
+            if self.profiler.enabled:  # Flush and close the JSONL log, if any.
+                self.profiler.disable()
+
+    def _run_idle(self):
+        """Block on input until a game starts, redrawing only after events.
+
+        The wait times out every settings.idle_timeout seconds so control
+        returns to Python now and then, e.g. to handle Ctrl+C.
+        """
+        self._update_screen()  # Show the menu once.
+        if self.startup is not None:  # The first frame is on screen.
+            self._finish_startup()
+        timeout = round(self.settings.idle_timeout * 1000)  # pygame waits in milliseconds.
+        while not self.stats.game_active:
+            event = pygame.event.wait(timeout)
+            if event.type == pygame.NOEVENT:  # Timed out; nothing changed.
+                continue
+            for event in [event] + pygame.event.get():  # Handle everything that is queued.
+                self._dispatch_event(event)
+            if not self.stats.game_active:  # Still idle: show what the input changed.
+                self._update_screen()
+        if self.profiler.enabled:  # Idle redraws are not part of the first game frame.
+            self.profiler.discard_frame()
+
+    def _finish_startup(self):
+        """Record the first frame and report the startup breakdown if asked to."""
+        self.startup.mark('first frame')
+        if self.settings.startup_report:
+            print(self.startup.report())
+        self.startup = None  # Only the first frame is timed.
+
+    def run_simulation(self, controller=None, max_ticks=None):
+        """Play one game as fast as possible, without the clock or drawing.
+
+        controller(ai_game, tick) is called before every step and returns the
+        input events for that tick. The game starts immediately and runs until
+        it is over or max_ticks steps have passed. Returns the number of steps.
+        """
+        dt = 1 / self.settings.tick_rate  # Length of one simulation step.
+        self._start_game()
+        tick = 0
+        while self.stats.game_active and (max_ticks is None or tick < max_ticks):
+            if controller is not None:
+                for event in controller(self, tick):  # Feed scripted input.
+                    self._handle_event(event)
+            self._step_simulation(dt)
+            tick += 1
+        return tick
+
+    def _step_simulation(self, dt):
+        """Advance the game by one simulation step of dt seconds."""
+        if self.stats.state == RESPAWNING:  # Hold everything still until the timer runs out.
+            self.stats.state_timer -= dt
+            if self.stats.state_timer < dt / 2:  # Less than half a step left.
+                self.stats.state = PLAYING
+            return
+
+        self.ship.update(dt)  # Update the ship's position.
+        self._update_bullets(dt)  # Update bullets.
+        self._update_aliens(dt)  # Update aliens.
 
     def _check_events(self):
         """Handle key presses and mouse events."""
         for event in pygame.event.get():  # Loop through event queue.
-            if event.type == pygame.QUIT:  # If the quit event is triggered.
-                sys.exit()  # Exit the game.
-            elif event.type == pygame.KEYDOWN:  # If a key is pressed down.
-                self._check_keydown_events(event)  # Check for specific key actions.
-            elif event.type == pygame.KEYUP:  # If a key is released.
-                self._check_keyup_events(event)  # Check for specific key releases.
-            elif event.type == pygame.MOUSEBUTTONDOWN:  # If a mouse button is clicked.
-                mouse_pos = pygame.mouse.get_pos()  # Get the mouse position.
-                self._check_play_button(mouse_pos)  # Check if the Play button was clicked.
+            self._dispatch_event(event)
+
+    def _dispatch_event(self, event):
+        """Map, record and handle one event from the queue."""
+        if self.presenter is not None:  # Clicks arrive in display coordinates.
+            event = self.presenter.to_logical(event)
+        if self.recorder is not None:  # Log the input before it changes the game.
+            self.recorder.record(self, self.ticks, event)
+        self._handle_event(event)
+
+    def _handle_event(self, event):
+        """Respond to a single input event, from the queue or a script."""
+        if event.type == pygame.QUIT:  # If the quit event is triggered.
+            sys.exit()  # Exit the game.
+        elif event.type == pygame.KEYDOWN:  # If a key is pressed down.
+            self._check_keydown_events(event)  # Check for specific key actions.
+        elif event.type == pygame.KEYUP:  # If a key is released.
+            self._check_keyup_events(event)  # Check for specific key releases.
+        elif event.type == pygame.MOUSEBUTTONDOWN:  # If a mouse button is clicked.
+            self._check_play_button(event.pos)  # Check if the Play button was clicked.
+        elif event.type == pygame.WINDOWEXPOSED:  # Part of the window needs repainting.
+            self.renderer.invalidate()  # Redraw and push the whole screen next frame.
+            if self.presenter is not None:
+                self.presenter.invalidate()  # The black bars need repainting too.
 
     def _check_play_button(self, mouse_pos):
         """Start a new game when the player clicks the Play button."""
         button_clicked = self.play_button.rect.collidepoint(mouse_pos)  # Check if the button was clicked.
         if button_clicked and not self.stats.game_active:  # If button is clicked and the game is inactive.
-            self.settings.initialize_dynamic_settings()  # Reset game settings.
+            self._start_game()
 
-            self.stats.reset_stats()  # Reset game statistics.
-            self.stats.game_active = True  # Set the game to active.
-            self.sb.prep_score()  # Prepare the scoreboard with current score.
-            self.sb.prep_level()  # Prepare the scoreboard with current level.
-            self.sb.prep_ships()  # Update the number of ships left.
+    def _start_game(self):
+        """Reset the settings, statistics and sprites and start a new game."""
+        self.settings.initialize_dynamic_settings()  # Reset game settings.
 
-            # Clear any existing aliens and bullets.
-            self.aliens.empty()
-            self.bullets.empty()
+        self.stats.reset_stats()  # Reset game statistics.
+        self.stats.game_active = True  # Set the game to active.
+        if self.leaderboard is not None:
+            self.leaderboard.new_game()  # Scores from now on belong to a new entry.
+        self.sb.prep_score()  # Prepare the scoreboard with current score.
+        self.sb.prep_level()  # Prepare the scoreboard with current level.
+        self.sb.prep_ships()  # Update the number of ships left.
 
-            self._create_fleet()  # Create a new fleet of aliens.
-            self.ship.center_ship()  # Center the ship on the screen.
+        # Clear any existing bullets; the new fleet replaces the old one.
+        self.bullets.empty()
+
+        self._create_fleet()  # Create a new fleet of aliens.
+        self.ship.center_ship()  # Center the ship on the screen.
 
-            pygame.mouse.set_visible(False)  # Hide the mouse cursor.
+        pygame.mouse.set_visible(False)  # Hide the mouse cursor.
 
     def _check_keydown_events(self, event):
         """Respond to key presses."""
@@ -96,6 +297,22 @@ class AlienInvasion:
             sys.exit()  # Exit the game.
         elif event.key == pygame.K_SPACE:  # If the space bar is pressed.
             self._fire_bullet()  # Fire a bullet.
+        elif event.key == pygame.K_F3:  # If F3 is pressed.
+            self.profiler.toggle_overlay()  # Show or hide the frame profiler overlay.
+        elif event.key == pygame.K_BACKSPACE:  # If Backspace is pressed.
+            self._rewind()  # Jump back about a second.
+
+    def _rewind(self):
+        """Restore the game to the snapshot taken about one second ago."""
+        if self.rewind is None or not self.stats.game_active:
+            return
+        steps = max(self.settings.tick_rate // self.settings.rewind_interval, 1)
+        data = self.rewind.rewind(steps)
+        if data is None:  # Nothing that far back yet.
+            return
+        moving = self.ship.moving_left, self.ship.moving_right  # Keys still held now.
+        restore(self, data)
+        self.ship.moving_left, self.ship.moving_right = moving
 
     def _check_keyup_events(self, event):
         """Handle key releases."""
@@ -105,30 +322,28 @@ class AlienInvasion:
             self.ship.moving_left = False  # Stop moving the ship left.
 
     def _fire_bullet(self):
-        """Create a new bullet and add it to the bullet group."""
+        """Fire a new bullet from the ship if the limit allows it."""
         if len(self.bullets) < self.settings.bullets_allowed:  # Check if bullets limit is not reached.
-            new_bullet = Bullet(self)  # Create a new Bullet instance.
-            self.bullets.add(new_bullet)  # Add the new bullet to the group.
+            self.bullets.fire(self.ship.rect.midtop)  # Fire from the ship's top middle.
 
-    def _update_bullets(self):
+    def _update_bullets(self, dt):
         """Update bullet positions and remove old bullets."""
-        self.bullets.update()  # Update the position of all bullets.
-
-        # Remove bullets that have gone off the screen.
-        for bullet in self.bullets.copy():  # Iterate through a copy of the bullets.
-            if bullet.rect.bottom <= 0:  # If the bullet has moved off the top of the screen.
-                self.bullets.remove(bullet)  # Remove the bullet.
-
-        self._check_bullet_alien_collisions()  # Check for collisions between bullets and aliens.
-
-    def _check_bullet_alien_collisions(self):
-        """Handle bullet-alien collisions."""
-        collisions = pygame.sprite.groupcollide(
-            self.bullets, self.aliens, True, True)  # Check for collisions and remove colliding sprites.
+        self.bullets.update(dt)  # Update the position of all bullets.
+        if not self.settings.swept_collisions:  # Swept paths are tested once the fleet has moved too.
+            self._check_bullet_alien_collisions(dt)  # Check for collisions between bullets and aliens.
+            self.bullets.cull()  # Remove bullets that have gone off the screen, in place.
+
+    def _check_bullet_alien_collisions(self, dt):
+        """Handle bullet-alien collisions after a step of dt seconds."""
+        if self.settings.swept_collisions:  # Test the whole path each bullet covered.
+            collisions = self.collider.sweep(self.bullets, self.settings.bullet_speed * dt)
+        else:
+            collisions = self.collider.collide(self.bullets)  # Find hits and remove the colliding bullets and aliens.
 
         if collisions:  # If any collisions occurred.
             for aliens in collisions.values():  # Iterate through the collided aliens.
                 self.stats.score += self.settings.alien_points * len(aliens)  # Update the score.
+                self.formation.clear(aliens)  # Erase them from the pre-rendered fleet.
             self.sb.prep_score()  # Update the score display.
             self.sb.check_high_score()  # Check for a new high score.
 
@@ -140,25 +355,27 @@ class AlienInvasion:
             self.stats.level += 1  # Increment the level.
             self.sb.prep_level()  # Update the level display.
 
-    def _update_aliens(self):
+    def _update_aliens(self, dt):
         """Check for edge conditions and update all aliens."""
-        self._check_fleet_edges()  # Check if aliens are at the screen edges.
-        self.aliens.update()  # Update the positions of all aliens.
-
-        # Check for collisions between the ship and aliens.
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
-            self._ship_hit()  # Handle the ship being hit.
+        self.fleet.update(dt)  # Turn at the edges and move the whole fleet.
+        if self.settings.swept_collisions:  # Bullets and fleet have both made this step's move.
+            # Check before culling, so a long step can't drop a bullet that passed through aliens.
+            self._check_bullet_alien_collisions(dt)
+            self.bullets.cull()
+
+        # Check for collisions between the ship and aliens, once the fleet is close enough.
+        if self.fleet.overlaps(self.ship.rect):
+            self.fleet.sync_sprites()  # Per-alien rects are only needed near the ship.
+            if pygame.sprite.spritecollideany(self.ship, self.aliens):
+                self._ship_hit()  # Handle the ship being hit.
 
         # Check for aliens reaching the bottom of the screen.
         self._check_aliens_bottom()
 
     def _check_aliens_bottom(self):
         """Check if any aliens have reached the bottom of the screen."""
-        screen_rect = self.screen.get_rect()  # Get the dimensions of the screen.
-        for alien in self.aliens.sprites():  # Loop through all aliens.
-            if alien.rect.bottom >= screen_rect.bottom:  # If an alien reaches the bottom.
-                self._ship_hit()  # Handle the ship being hit.
-                break  # Exit the loop.
+        if self.fleet.reached_bottom():  # The fleet's bounding box touches the bottom.
+            self._ship_hit()  # Handle the ship being hit.
 
     def _ship_hit(self):
         """Handle the event of the ship being hit by an alien."""
@@ -166,22 +383,26 @@ class AlienInvasion:
             self.stats.ships_left -= 1  # Decrease the number of remaining ships.
             self.sb.prep_ships()  # Update the ships display.
 
-            # Clear remaining aliens and bullets.
-            self.aliens.empty()
+            # Clear remaining bullets; the new fleet replaces the old one.
             self.bullets.empty()
 
             self._create_fleet()  # Create a new fleet of aliens.
             self.ship.center_ship()  # Center the ship on the screen.
 
-            sleep(0.5)  # Pause for half a second.
+            # Pause the action without blocking input or rendering.
+            if self.settings.respawn_time > 0:
+                self.stats.state = RESPAWNING
+                self.stats.state_timer = self.settings.respawn_time
         else:
             self.stats.game_active = False  # Set the game to inactive.
+            if self.leaderboard is not None:  # Keep the final score if it makes the top list.
+                self.leaderboard.record(self.stats.score, self.stats.level)
             pygame.mouse.set_visible(True)  # Show the mouse cursor.
 
     def _create_fleet(self):
         """Create a fleet of aliens."""
-        alien = Alien(self)  # Create an instance of Alien to use for calculations.
-        alien_width, alien_height = alien.rect.size  # Get the size of the alien.
+        alien_image = self.assets.image('alien.bmp')  # Use the cached image for calculations.
+        alien_width, alien_height = alien_image.get_size()  # Get the size of the alien.
         available_space_x = self.settings.screen_width - (2 * alien_width)  # Calculate available space on x-axis.
         number_aliens_x = available_space_x // (2 * alien_width)  # Calculate the number of aliens that fit in the space.
 
@@ -191,47 +412,34 @@ class AlienInvasion:
         number_rows = available_space_y // (2 * alien_height)  # Calculate the number of rows.
 
         # Create the fleet of aliens.
-        for row_number in range(number_rows):  # For each row.
-            for alien_number in range(number_aliens_x):  # For each alien in the row.
-                self._create_alien(alien_number, row_number)  # Create an alien.
-
-    def _create_alien(self, alien_number, row_number):
-        """Create an alien and place it in the fleet."""
-        alien = Alien(self)  # Create an instance of Alien.
-        alien_width, alien_height = alien.rect.size  # Get the size of the alien.
-        alien.x = alien_width + 2 * alien_width * alien_number  # Set the x position of the alien.
-        alien.rect.x = alien.x  # Update the x coordinate of the alien's rect.
-        alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number  # Set the y position of the alien.
-        self.aliens.add(alien)  # Add the alien to the group.
-
-    def _check_fleet_edges(self):
-        """Respond appropriately if any aliens reach the edge of the screen."""
-        for alien in self.aliens.sprites():  # Loop through all aliens.
-            if alien.check_edges():  # If the alien is at the edge.
-                self._change_fleet_direction()  # Change the fleet's direction.
-                break  # Exit the loop.
-
-    def _change_fleet_direction(self):
-        """Drop the entire fleet and change its direction."""
-        for alien in self.aliens.sprites():  # Loop through all aliens.
-            alien.rect.y += self.settings.fleet_drop_speed  # Move the fleet down.
-        self.settings.fleet_direction *= -1  # Change the direction of the fleet.
+        self.fleet.create(number_aliens_x, number_rows)
+        self.formation.rebuild()  # Composite the new fleet once.
 
     def _update_screen(self):
         """Update images on the screen and flip to the new screen."""
+        if self.settings.dirty_rendering:  # Push only the regions that changed.
+            self.renderer.draw()
+            return
+
         self.screen.fill(self.settings.bg_color)  # Fill the screen with the background color.
+        self._draw_game()  # Draw every game element.
+        if self.presenter is not None:  # Scale the logical screen to the display.
+            self.presenter.flip()
+        else:
+            pygame.display.flip()  # Refresh the screen to display the new updates.
+
+    def _draw_game(self):
+        """Draw the ship, bullets, aliens, scoreboard and Play button."""
         self.ship.blitme()  # Draw the ship on the screen.
-        for bullet in self.bullets.sprites():  # Draw each bullet.
-            bullet.draw_bullet()  # Call the bullet's draw method.
-        self.aliens.draw(self.screen)  # Draw all aliens.
+        self.bullets.draw()  # Draw all bullets in one batch.
+        self.formation.draw()  # Draw all aliens in one blit.
 
         # Draw the score and level information.
         self.sb.show_score()  # Display the score.
         # If the game is inactive, display the Play button.
         if not self.stats.game_active:  
             self.play_button.draw_button()  # Draw the Play button.
-
-        pygame.display.flip()  # Refresh the screen to display the new updates.
+        self.profiler.draw()  # Draw the profiler overlay, if it is showing.
 
 # Run the game if this module is executed.
 if __name__ == '__main__':
@@ -0,0 +1,91 @@
+import io  # Import io to decode images straight from the bundle's bytes.
+import mmap  # Import mmap to map the asset bundle instead of reading it.
+import os  # Import os for building asset paths.
+import zipfile  # Import zipfile to read the packed asset bundle.
+
+import pygame  # Import the pygame module for image loading.
+
+
+class AssetCache:
+    """Class to load each game image once and share it between sprites.
+
+    Images are read from the packed bundle when one is given and holds them,
+    otherwise from the loose files in base_dir.
+    """
+
+    def __init__(self, base_dir='images', bundle=None):
+        """Initialize an empty cache that reads images from bundle or base_dir."""
+        self.base_dir = base_dir  # Folder the image files are loaded from.
+        self._images = {}  # Map of image name to its loaded Surface.
+        self._bundle = _open_bundle(bundle) if bundle else None  # Packed images, if available.
+
+        # Counters used to confirm that repeated requests do no file I/O.
+        self.hits = 0  # Number of requests served from the cache.
+        self.misses = 0  # Number of requests that had to load from disk.
+
+    def image(self, name):
+        """Return the shared Surface for the named image, loading it on first use."""
+        surface = self._images.get(name)  # Look for an already loaded image.
+        if surface is not None:  # If the image is cached.
+            self.hits += 1  # Count the cache hit.
+            return surface  # Hand back the shared Surface.
+
+        self.misses += 1  # Count the cache miss.
+        surface = self._load(name)  # Decode the image from the bundle or its file.
+        if pygame.display.get_surface() is not None:  # convert() needs a display mode.
+            surface = surface.convert()  # Match the display pixel format for fast blits.
+        self._images[name] = surface  # Store the Surface for later requests.
+        return surface
+
+    def _load(self, name):
+        """Decode the named image from the bundle, falling back to the loose file."""
+        if self._bundle is not None:
+            member = f"{self.base_dir}/{name}"  # Bundles keep the images folder layout.
+            try:
+                data = self._bundle.read(member)
+            except KeyError:
+                pass  # Not packed; use the loose file.
+            else:
+                return pygame.image.load(io.BytesIO(data), name)  # The name gives the format.
+        return pygame.image.load(os.path.join(self.base_dir, name))
+
+    def override(self, name, surface):
+        """Serve surface for name from now on instead of the image file."""
+        self._images[name] = surface
+
+    def solid(self, size, color):
+        """Return a shared Surface of the given size filled with color."""
+        key = ('solid', tuple(size), tuple(color))  # Solid fills never clash with file names.
+        surface = self._images.get(key)  # Look for an already built Surface.
+        if surface is None:  # Build it on first use; no file I/O is involved.
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            self._images[key] = surface
+        return surface
+
+    def clear(self):
+        """Drop every cached image, e.g. after the display mode changes."""
+        self._images.clear()  # Forget the loaded Surfaces.
+
+    def stats(self):
+        """Return the cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'cached': len(self._images)}
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map that zipfile accepts as a seekable file."""
+
+    def seekable(self):
+        """Report that the map supports seek(), which zipfile checks for."""
+        return True
+
+
+def _open_bundle(path):
+    """Return a ZipFile over the memory-mapped bundle at path, or None if it is missing."""
+    try:
+        with open(path, 'rb') as file:
+            mapped = _MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):  # ValueError: an empty file cannot be mapped.
+        return None
+    return zipfile.ZipFile(mapped)
@@ -0,0 +1,73 @@
+"""Benchmark the game's collider against pygame.sprite.groupcollide.
+
+Run from the folder that holds images/:  python bench_collisions.py
+"""
+import random  # Import random to scatter bullets reproducibly.
+import timeit  # Import timeit for the timings.
+
+import pygame  # Import the pygame module for the reference collision test.
+
+from alien_invasion import AlienInvasion  # Import the game to build a real fleet.
+from bullet import BulletPool  # Import BulletPool to hold the scattered bullets.
+
+BULLET_COUNTS = (3, 30, 100, 300, 1000)  # Values of bullets_allowed to compare.
+SCREEN_SIZES = ((1200, 800), (3840, 2160))  # Default and 4K fleet layouts.
+REPEATS = 50  # Collision passes timed per measurement.
+
+
+def scatter_bullets(ai_game, count, rng):
+    """Return a pool of count bullets spread over the fleet's area."""
+    bullets = BulletPool(ai_game)
+    for _ in range(count):
+        bullets.add(rng.randrange(0, ai_game.settings.screen_width),
+                    rng.randrange(0, int(ai_game.fleet.bottom) + 1))
+    return bullets
+
+
+def bullet_sprites(bullets):
+    """Return a Group of plain sprites matching the pool, for groupcollide."""
+    group = pygame.sprite.Group()
+    for slot, rect in enumerate(bullets.rects()):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect, sprite.slot = rect, slot
+        group.add(sprite)
+    return group
+
+
+def run_scenario(ai_game, width, height, rng):
+    """Lay out a fleet for a width x height screen and time both collision paths."""
+    ai_game.settings.screen_width, ai_game.settings.screen_height = width, height
+    ai_game._create_fleet()  # Fleet size follows the screen size.
+    ai_game.fleet.sync_sprites()  # groupcollide needs current alien rects.
+
+    print(f"\n{width}x{height}: {len(ai_game.aliens)} aliens, {REPEATS} passes per measurement")
+    print(f"{'bullets':>8} {'groupcollide ms':>16} {'collider ms':>11} {'speedup':>8}")
+    for count in BULLET_COUNTS:
+        bullets = scatter_bullets(ai_game, count, rng)
+        sprites = bullet_sprites(bullets)
+
+        # Both paths must agree before their timings mean anything.
+        expected = {sprite.slot: aliens for sprite, aliens in
+                    pygame.sprite.groupcollide(sprites, ai_game.aliens, False, False).items()}
+        actual = ai_game.collider.collide(bullets, dokill=False)
+        assert expected == actual, "collider disagrees with groupcollide"
+
+        brute = timeit.timeit(
+            lambda: pygame.sprite.groupcollide(sprites, ai_game.aliens, False, False),
+            number=REPEATS) * 1000 / REPEATS
+        collider = timeit.timeit(
+            lambda: ai_game.collider.collide(bullets, dokill=False),
+            number=REPEATS) * 1000 / REPEATS
+        print(f"{count:>8} {brute:>16.3f} {collider:>11.3f} {brute / collider:>7.1f}x")
+
+
+def main():
+    """Time both collision paths at the default and a 4K screen size."""
+    ai_game = AlienInvasion(headless=True)  # No window, and no leaderboard writer.
+    rng = random.Random(0)
+    for width, height in SCREEN_SIZES:
+        run_scenario(ai_game, width, height, rng)
+
+
+if __name__ == '__main__':
+    main()
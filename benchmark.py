@@ -0,0 +1,179 @@
+"""Time each phase of the game loop under repeatable scenarios.
+
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.15
+
+Run from the folder that holds images/. With --compare, any phase whose mean
+time grew by more than the threshold is reported and the exit status is 1.
+"""
+import argparse  # Import argparse for the command-line options.
+import json  # Import json to save and load baselines.
+import platform  # Import platform to record where a baseline was taken.
+import statistics  # Import statistics for the timing summaries.
+import sys  # Import sys for the exit status.
+import time  # Import time for the phase timers.
+
+import pygame  # Import pygame to scale the alien image.
+
+from alien_invasion import AlienInvasion  # Import the game to benchmark.
+from settings import Settings  # Import Settings to size each scenario.
+
+# Loop phases timed every frame, as method names on AlienInvasion or its ship.
+FRAME_PHASES = ('_check_events', 'ship.update', '_update_bullets',
+                '_check_bullet_alien_collisions', '_update_aliens', '_update_screen')
+
+# Scenario name mapped to (screen size, alien scale, bullets allowed, ticks between shots).
+SCENARIOS = {
+    'default': ((1200, 800), 1.0, 3, 15),
+    '4k': ((3840, 2160), 1.0, 3, 15),
+    'dense': ((3840, 2160), 0.25, 3, 15),
+    'bullets': ((1200, 800), 1.0, 500, 1),
+}
+
+
+class PhaseTimer:
+    """Wrap methods of a game so every call records its duration."""
+
+    def __init__(self):
+        """Initialize empty timing lists."""
+        self.samples = {}  # Map of phase name to call durations in seconds.
+
+    def wrap(self, owner, attribute, name):
+        """Replace owner.attribute with a timed version recorded under name."""
+        method = getattr(owner, attribute)
+        samples = self.samples.setdefault(name, [])
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            samples.append(time.perf_counter() - start)
+            return result
+
+        setattr(owner, attribute, timed)  # Instance attribute shadows the method.
+
+
+def build_game(size, alien_scale, bullets_allowed):
+    """Return a headless game laid out for one scenario."""
+    settings = Settings()
+    settings.screen_width, settings.screen_height = size
+    settings.bullets_allowed = bullets_allowed
+    ai_game = AlienInvasion(headless=True, settings=settings)
+    if alien_scale != 1.0:  # Shrink the alien to pack the fleet more densely.
+        image = ai_game.assets.image('alien.bmp')
+        width, height = image.get_size()
+        scaled = pygame.transform.scale(image, (max(1, int(width * alien_scale)),
+                                                max(1, int(height * alien_scale))))
+        ai_game.assets.override('alien.bmp', scaled)
+    ai_game._start_game()  # Lay out a fresh fleet and make the game active.
+    return ai_game
+
+
+def run_scenario(name, frames, fleet_repeats):
+    """Play frames frames of a scenario and return per-phase statistics."""
+    size, alien_scale, bullets_allowed, fire_every = SCENARIOS[name]
+    ai_game = build_game(size, alien_scale, bullets_allowed)
+    dt = 1 / ai_game.settings.tick_rate
+
+    timer = PhaseTimer()
+    for phase in FRAME_PHASES:
+        owner, _, attribute = phase.rpartition('.')
+        timer.wrap(getattr(ai_game, owner) if owner else ai_game, attribute, phase)
+
+    for frame in range(frames):
+        # Sweep the ship across the screen and fire on a fixed schedule.
+        ai_game.ship.moving_right = (frame // 240) % 2 == 0
+        ai_game.ship.moving_left = not ai_game.ship.moving_right
+        if frame % fire_every == 0:
+            ai_game._fire_bullet()
+
+        ai_game._check_events()
+        if not ai_game.stats.game_active:  # Keep playing after a game over.
+            ai_game._start_game()
+        ai_game.ship.update(dt)
+        ai_game._update_bullets(dt)
+        ai_game._update_aliens(dt)
+        ai_game._update_screen()
+
+    # Fleet creation happens between waves rather than every frame.
+    timer.wrap(ai_game, '_create_fleet', '_create_fleet')
+    for _ in range(fleet_repeats):
+        ai_game._create_fleet()
+
+    results = {'aliens': ai_game.fleet.x.size, 'phases': {}}
+    for phase, samples in timer.samples.items():
+        samples_ms = sorted(sample * 1000 for sample in samples)
+        results['phases'][phase] = {
+            'calls': len(samples_ms),
+            'mean_ms': statistics.fmean(samples_ms),
+            'p50_ms': samples_ms[len(samples_ms) // 2],
+            'p95_ms': samples_ms[int(len(samples_ms) * 0.95)],
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the (scenario, phase, old, new) means that regressed beyond threshold."""
+    regressions = []
+    for scenario, scenario_results in results['scenarios'].items():
+        old_phases = baseline['scenarios'].get(scenario, {}).get('phases', {})
+        for phase, stats in scenario_results['phases'].items():
+            if phase not in old_phases:
+                continue
+            old, new = old_phases[phase]['mean_ms'], stats['mean_ms']
+            if new > old * (1 + threshold):
+                regressions.append((scenario, phase, old, new))
+    return regressions
+
+
+def print_results(results):
+    """Print a table of mean and p95 times per scenario and phase."""
+    for scenario, scenario_results in results['scenarios'].items():
+        print(f"\n{scenario} ({scenario_results['aliens']} aliens)")
+        print(f"{'phase':<32} {'calls':>6} {'mean ms':>9} {'p95 ms':>9}")
+        for phase, stats in scenario_results['phases'].items():
+            print(f"{phase:<32} {stats['calls']:>6} {stats['mean_ms']:>9.3f} {stats['p95_ms']:>9.3f}")
+
+
+def main():
+    """Run the selected scenarios, then save and/or compare the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable; default: all)")
+    parser.add_argument('--frames', type=int, default=600, help="frames per scenario")
+    parser.add_argument('--fleet-repeats', type=int, default=5,
+                        help="fleet creations timed per scenario")
+    parser.add_argument('--save', metavar='PATH', help="write results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown as a fraction of the baseline mean")
+    args = parser.parse_args()
+
+    results = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'frames': args.frames,
+        'scenarios': {},
+    }
+    for name in args.scenario or SCENARIOS:
+        results['scenarios'][name] = run_scenario(name, args.frames, args.fleet_repeats)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for scenario, phase, old, new in regressions:
+            print(f"REGRESSION {scenario}/{phase}: {old:.3f} ms -> {new:.3f} ms "
+                  f"(+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+
+
+if __name__ == '__main__':
+    main()
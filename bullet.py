@@ -1,30 +1,96 @@
+import numpy as np  # Import NumPy for the array-backed bullet storage.
 import pygame  # Import the pygame module for game development.
-from pygame.sprite import Sprite  # Import the Sprite class for creating game objects.
 
-class Bullet(Sprite):
-    """Class to handle bullets fired from the spaceship."""
+from geometry import to_pixels  # Import Rect-style rounding for bullet positions.
+
+
+class BulletPool:
+    """Class to store every bullet fired from the spaceship in parallel arrays.
+
+    Live bullets occupy the first len(pool) slots, in the order they were
+    fired. Slots are reused, so firing does not allocate once the pool has
+    reached the size the game needs.
+    """
 
     def __init__(self, ai_game):
-        """Initialize a bullet object at the ship's current position."""
-        super().__init__()  # Call the parent class (Sprite) constructor.
+        """Initialize an empty pool sized for the allowed number of bullets."""
         self.screen = ai_game.screen  # Get the game screen from the main game instance.
         self.settings = ai_game.settings  # Access game settings for bullet attributes.
-        self.color = self.settings.bullet_color  # Set the bullet color from settings.
+        self.width = self.settings.bullet_width  # Width of every bullet.
+        self.height = self.settings.bullet_height  # Height of every bullet.
+
+        # Share one filled image between all bullets so they are drawn in one blits() call.
+        self.image = ai_game.assets.solid((self.width, self.height), self.settings.bullet_color)
+
+        capacity = max(self.settings.bullets_allowed, 1)  # Initial number of slots.
+        self.x = np.zeros(capacity, dtype=int)  # Left edge of each bullet.
+        self.y = np.zeros(capacity)  # Exact top of each bullet.
+        self.count = 0  # Number of live bullets.
+
+        self._spawn_rect = pygame.Rect(0, 0, self.width, self.height)  # Scratch rect for firing.
+
+    def __len__(self):
+        """Return the number of live bullets."""
+        return self.count
+
+    def fire(self, midtop):
+        """Add a bullet whose top middle sits at midtop."""
+        self._spawn_rect.midtop = midtop  # Position the bullet like a Rect would.
+        self.add(self._spawn_rect.x, self._spawn_rect.y)
+
+    def add(self, x, y):
+        """Add a bullet with its top-left corner at (x, y)."""
+        if self.count == self.x.size:  # Grow only when every slot is in use.
+            self.x = np.resize(self.x, self.count * 2)
+            self.y = np.resize(self.y, self.count * 2)
+        self.x[self.count] = x
+        self.y[self.count] = y
+        self.count += 1
+
+    def update(self, dt):
+        """Move every bullet upwards over dt seconds."""
+        self.y[:self.count] -= self.settings.bullet_speed * dt  # One batch update.
+
+    def cull(self):
+        """Remove the bullets that have gone off the top of the screen."""
+        gone = to_pixels(self.y[:self.count]) + self.height <= 0  # Bullet bottoms above the screen.
+        if gone.any():
+            self.remove(np.flatnonzero(gone))
+
+    def remove(self, slots):
+        """Remove the bullets in the given slots, keeping the others in firing order."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[slots] = False
+        kept = int(keep.sum())
+        self.x[:kept] = self.x[:self.count][keep]  # Compact the live bullets to the front.
+        self.y[:kept] = self.y[:self.count][keep]
+        self.count = kept
+
+    def empty(self):
+        """Remove every bullet."""
+        self.count = 0
 
-        # Create a bullet rectangle at (0, 0) and position it correctly.
-        self.rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)  # Define the bullet's rectangle.
-        self.rect.midtop = ai_game.ship.rect.midtop  # Position the bullet at the ship's current top middle.
+    def restore(self, x, y):
+        """Replace the live bullets with the given x and y arrays."""
+        count = len(x)
+        if count > self.x.size:  # Grow to fit, like add().
+            self.x = np.resize(self.x, count)
+            self.y = np.resize(self.y, count)
+        self.x[:count] = x
+        self.y[:count] = y
+        self.count = count
 
-        # Store the bullet's vertical position as a floating-point number for precise movement.
-        self.y = float(self.rect.y)  # Initialize the y-coordinate of the bullet.
+    def positions(self):
+        """Return the whole-pixel (x list, y list) of the live bullets."""
+        return self.x[:self.count].tolist(), to_pixels(self.y[:self.count]).tolist()
 
-    def update(self):
-        """Move the bullet upwards on the screen."""
-        # Decrease the bullet's y position based on its speed.
-        self.y -= self.settings.bullet_speed  # Update the bullet's decimal y-coordinate.
-        self.rect.y = self.y  # Update the rectangle's y-coordinate to match the decimal position.
+    def rects(self):
+        """Return a Rect for every live bullet."""
+        xs, ys = self.positions()
+        return [pygame.Rect(x, y, self.width, self.height) for x, y in zip(xs, ys)]
 
-    def draw_bullet(self):
-        """Render the bullet on the screen."""
-        # Draw the bullet rectangle using the specified color.
-        pygame.draw.rect(self.screen, self.color, self.rect)  # Render the bullet on the game screen.
+    def draw(self):
+        """Render every bullet on the screen in one batch."""
+        xs, ys = self.positions()
+        self.screen.blits([(self.image, position) for position in zip(xs, ys)],
+                          doreturn=False)
@@ -1,4 +1,4 @@
-import pygame.font  # Import the font module from pygame for text rendering.
+import pygame  # Import pygame for the button rectangle.
 
 
 class Button:
@@ -13,7 +13,7 @@ class Button:
         self.width, self.height = 200, 50  # Set the width and height of the button.
         self.button_color = (0, 255, 0)  # Set the button's background color to green.
         self.text_color = (255, 255, 255)  # Set the text color to white.
-        self.font = pygame.font.SysFont(None, 48)  # Load a default font for rendering text.
+        self.fonts = ai_game.fonts  # Shared fonts and rendered text caches.
 
         # Create a rectangle for the button and center it on the screen.
         self.rect = pygame.Rect(0, 0, self.width, self.height)  # Create the button's rectangle.
@@ -25,7 +25,7 @@ class Button:
     def _prepare_message(self, msg):
         """Render the button message into an image and center it on the button."""
         # Create an image of the text message and set its background color.
-        self.msg_image = self.font.render(msg, True, self.text_color, self.button_color)  # Render the text message.
+        self.msg_image = self.fonts.render(msg, self.text_color, self.button_color)  # Render the text message.
         self.msg_image_rect = self.msg_image.get_rect()  # Get the rectangle of the rendered message image.
         self.msg_image_rect.center = self.rect.center  # Center the message rectangle on the button.
 
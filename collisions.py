@@ -0,0 +1,215 @@
+import math  # Import math for the infinite overlap times.
+from bisect import bisect_left, bisect_right  # Import bisection to index the lattice.
+
+import numpy as np  # Import NumPy to filter bullets in one pass.
+import pygame  # Import pygame for the rect tests of the direct path.
+
+from geometry import to_pixel, to_pixels  # Import Rect-style rounding for bullet positions.
+
+# Bullet-alien pairs below which testing every pair beats setting up the lattice.
+DIRECT_TESTS = 1000
+
+
+class LatticeCollider:
+    """Class to find bullet-alien hits through the fleet's column/row lattice.
+
+    The fleet is laid out on a fixed lattice and moves as a rigid body, so the
+    aliens a bullet can touch are found by arithmetic instead of testing the
+    bullet against every alien. Results match pygame.sprite.groupcollide.
+    With only a few bullets and aliens, the NumPy and lattice set-up costs
+    more than the tests it saves, so each bullet near the fleet is tested
+    against the aliens' rects directly instead.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize the collider for the game's fleet."""
+        self.fleet = ai_game.fleet  # The array-backed alien fleet.
+
+    def collide(self, bullets, dokill=True):
+        """Return a dict mapping the slot of each hitting bullet to the aliens it hit.
+
+        With dokill, hit bullets leave the pool and hit aliens leave the fleet.
+        Bullets are tested in firing order, so results match
+        groupcollide(bullets, aliens, True, True) on the equivalent sprites.
+        """
+        fleet = self.fleet
+        collisions = {}  # Bullet slots mapped to the aliens they hit.
+        if not fleet.aliens or not bullets:  # Nothing to test.
+            return collisions
+        if len(bullets) * len(fleet) <= DIRECT_TESTS:  # Too few pairs to pay for the lattice.
+            return self._collide_direct(bullets, dokill)
+
+        # Only bullets near the fleet's bounding box (one pixel of rounding slack) can hit.
+        bullet_w, bullet_h = bullets.width, bullets.height  # Size of every bullet.
+        bullet_x = bullets.x[:len(bullets)]
+        bullet_y = to_pixels(bullets.y[:len(bullets)])
+        near = np.flatnonzero((bullet_y + bullet_h > fleet.top - 1) & (bullet_y < fleet.bottom + 1)
+                              & (bullet_x + bullet_w > fleet.left - 1) & (bullet_x < fleet.right + 1))
+        if not near.size:
+            return collisions
+
+        width, height = fleet.alien_width, fleet.alien_height  # Size of one alien.
+        columns = fleet.number_aliens_x
+        # Every alien in a column shares its x, and every alien in a row its y.
+        column_x = fleet.column_positions()
+        row_y = fleet.row_positions()
+        left, right = column_x[0], column_x[-1] + width  # Pixel extent of the lattice.
+        top, bottom = row_y[0], row_y[-1] + height
+        alive = fleet.alive.tolist()  # Alive flags as a plain list for fast lookups.
+        killed = []  # Aliens removed by this call.
+
+        for slot in near.tolist():  # Bullets in firing order, like groupcollide.
+            bullet_left, bullet_top = int(bullet_x[slot]), int(bullet_y[slot])
+            bullet_right, bullet_bottom = bullet_left + bullet_w, bullet_top + bullet_h
+            if (bullet_right <= left or bullet_left >= right
+                    or bullet_bottom <= top or bullet_top >= bottom):
+                continue  # The bullet is outside the lattice.
+
+            # Columns and rows whose cells overlap the bullet.
+            first_col = bisect_right(column_x, bullet_left - width)
+            last_col = bisect_left(column_x, bullet_right)
+            first_row = bisect_right(row_y, bullet_top - height)
+            last_row = bisect_left(row_y, bullet_bottom)
+
+            hits = []  # Aliens this bullet touches, in fleet order.
+            for row in range(first_row, last_row):
+                for col in range(first_col, last_col):
+                    index = row * columns + col  # Slot in the fleet arrays.
+                    if alive[index]:
+                        hits.append(fleet.sprites[index])
+                        if dokill:
+                            alive[index] = False  # A dead alien can't be hit twice.
+
+            if hits:
+                collisions[slot] = hits
+                killed.extend(hits)
+
+        if dokill and killed:
+            bullets.remove(list(collisions))  # Drop the bullets that hit something.
+            fleet.kill(killed)  # Drop the aliens and shrink the bounding box.
+        return collisions
+
+    def _collide_direct(self, bullets, dokill):
+        """collide() for a few bullets: test each one near the fleet against the aliens' rects."""
+        fleet = self.fleet
+        collisions = {}  # Bullet slots mapped to the aliens they hit.
+        bullet_w, bullet_h = bullets.width, bullets.height  # Size of every bullet.
+        count = len(bullets)
+
+        # Plain Python filtering, since NumPy's per-call overhead dominates for a few bullets.
+        top, bottom = fleet.top - bullet_h - 2, fleet.bottom + 2  # Slack covers y's rounding.
+        left, right = fleet.left - bullet_w - 1, fleet.right + 1
+        near = [(slot, x, y) for slot, (x, y)
+                in enumerate(zip(bullets.x[:count].tolist(), bullets.y[:count].tolist()))
+                if top < y < bottom and left < x < right]
+        if not near:
+            return collisions
+
+        fleet.sync_sprites()  # Test the same rects groupcollide would.
+        aliens = fleet.aliens.sprites()  # Living aliens in fleet order.
+        rects = [alien.rect for alien in aliens]
+        killed = []  # Aliens removed by this call.
+
+        for slot, x, y in near:  # Bullets in firing order, like groupcollide.
+            bullet_rect = pygame.Rect(x, to_pixel(y), bullet_w, bullet_h)
+            hits = [aliens[index] for index in bullet_rect.collidelistall(rects)]
+            if dokill and killed:
+                hits = [alien for alien in hits if alien not in killed]  # A dead alien can't be hit twice.
+            if hits:
+                collisions[slot] = hits
+                killed.extend(hits)
+
+        if dokill and killed:
+            bullets.remove(list(collisions))  # Drop the bullets that hit something.
+            fleet.kill(killed)  # Drop the aliens and shrink the bounding box.
+        return collisions
+
+    def sweep(self, bullets, distance, dokill=True):
+        """Like collide(), but test the whole path each bullet covered during the step.
+
+        Call it once the bullets have moved distance pixels up and the fleet
+        has moved by fleet.step, both over the same step; in the fleet's frame
+        each bullet then slid along a straight line. A bullet hits the first living aliens on that line, so
+        no step is too long to catch a hit. Exact float positions are used
+        instead of whole pixels.
+        """
+        fleet = self.fleet
+        collisions = {}  # Bullet slots mapped to the aliens they hit.
+        if not fleet.aliens or not bullets:  # Nothing to test.
+            return collisions
+
+        # Motion of the bullets relative to the fleet; each bullet ends at its current position.
+        fleet_dx, fleet_dy = fleet.step
+        move_x, move_y = -fleet_dx, -distance - fleet_dy
+        bullet_w, bullet_h = bullets.width, bullets.height  # Size of every bullet.
+        end_x = bullets.x[:len(bullets)].astype(float)
+        end_y = bullets.y[:len(bullets)]
+        start_x, start_y = end_x - move_x, end_y - move_y
+
+        # Only bullets whose path crosses the fleet's bounding box can hit.
+        low_x, low_y = np.minimum(start_x, end_x), np.minimum(start_y, end_y)
+        high_x = np.maximum(start_x, end_x) + bullet_w
+        high_y = np.maximum(start_y, end_y) + bullet_h
+        near = np.flatnonzero((high_y > fleet.top) & (low_y < fleet.bottom)
+                              & (high_x > fleet.left) & (low_x < fleet.right))
+        if not near.size:
+            return collisions
+
+        width, height = fleet.alien_width, fleet.alien_height  # Size of one alien.
+        columns = fleet.number_aliens_x
+        column_x = fleet.x[:columns].tolist()  # Every alien in a column shares its x.
+        row_y = fleet.y[::columns].tolist()  # Every alien in a row shares its y.
+        alive = fleet.alive.tolist()  # Alive flags as a plain list for fast lookups.
+        killed = []  # Aliens removed by this call.
+
+        for slot in near.tolist():  # Bullets in firing order, like collide().
+            # Columns and rows whose cells overlap the bullet's path.
+            first_col = bisect_right(column_x, low_x[slot] - width)
+            last_col = bisect_left(column_x, high_x[slot])
+            first_row = bisect_right(row_y, low_y[slot] - height)
+            last_row = bisect_left(row_y, high_y[slot])
+
+            # Times along the path when the bullet overlaps each column and row.
+            column_times = [_overlap_times(start_x[slot], bullet_w, move_x, column_x[col], width)
+                            for col in range(first_col, last_col)]
+            row_times = [_overlap_times(start_y[slot], bullet_h, move_y, row_y[row], height)
+                         for row in range(first_row, last_row)]
+
+            first_time, hits = None, []  # Earliest contact and the aliens touched then.
+            for row, (row_enter, row_exit) in enumerate(row_times, start=first_row):
+                for col, (col_enter, col_exit) in enumerate(column_times, start=first_col):
+                    index = row * columns + col  # Slot in the fleet arrays.
+                    enter, leave = max(row_enter, col_enter), min(row_exit, col_exit)
+                    if not alive[index] or enter >= leave or enter >= 1 or leave <= 0:
+                        continue  # Dead, or never overlapping during this step.
+                    enter = max(enter, 0.0)
+                    if first_time is None or enter < first_time:
+                        first_time, hits = enter, [index]
+                    elif enter == first_time:
+                        hits.append(index)
+
+            if hits:
+                if dokill:
+                    for index in hits:
+                        alive[index] = False  # A dead alien can't be hit twice.
+                collisions[slot] = [fleet.sprites[index] for index in hits]
+                killed.extend(collisions[slot])
+
+        if dokill and killed:
+            bullets.remove(list(collisions))  # Drop the bullets that hit something.
+            fleet.kill(killed)  # Drop the aliens and shrink the bounding box.
+        return collisions
+
+
+def _overlap_times(start, size, move, cell, cell_size):
+    """Return the open interval of t in which a span moving by t * move overlaps a cell.
+
+    The span starts at [start, start + size) and the cell is [cell, cell + cell_size).
+    """
+    if move == 0:  # Stationary on this axis: always or never overlapping.
+        if start < cell + cell_size and start + size > cell:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+    enter = (cell - start - size) / move  # Leading edge meets the cell.
+    leave = (cell + cell_size - start) / move  # Trailing edge clears the cell.
+    return (enter, leave) if move > 0 else (leave, enter)
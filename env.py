@@ -0,0 +1,217 @@
+"""Gym-style environments for automated players.
+
+    python env.py --envs 4 --steps 2000
+
+AlienInvasionEnv wraps one headless game with reset()/step(action).
+VectorAlienInvasionEnv steps several of them, one per worker process, and
+collects their observations in a shared-memory NumPy array.
+"""
+import argparse  # Import argparse for the command-line options.
+import multiprocessing  # Import multiprocessing for the worker processes.
+import time  # Import time to report throughput.
+from multiprocessing import shared_memory  # Import shared memory for batched observations.
+
+import numpy as np  # Import NumPy for observations.
+
+from settings import Settings  # Import Settings for the headless games.
+
+# Actions: which way the ship moves and whether it fires this step.
+NOOP, LEFT, RIGHT, FIRE, LEFT_FIRE, RIGHT_FIRE = range(6)
+ACTION_MOVES = {NOOP: (False, False), LEFT: (True, False), RIGHT: (False, True),
+                FIRE: (False, False), LEFT_FIRE: (True, False), RIGHT_FIRE: (False, True)}
+FIRING_ACTIONS = {FIRE, LEFT_FIRE, RIGHT_FIRE}
+
+
+class AlienInvasionEnv:
+    """Class to drive one headless game through reset() and step(action).
+
+    An observation is a float32 vector: the ship's x, the fleet's offset and
+    direction, ships left, the fleet's alive mask, and (x, y) for each bullet
+    slot (-1 when empty). Positions are scaled by the screen size. The reward
+    is the score gained during the step; done is True once the game is over.
+    """
+
+    def __init__(self, seed=None, frame_skip=4, settings=None):
+        """Initialize the game; each step runs frame_skip simulation ticks."""
+        from alien_invasion import AlienInvasion  # Imported here so workers import it themselves.
+
+        if settings is None:
+            settings = Settings()
+            settings.respawn_time = 0  # Nothing watches the pause, so skip it.
+        self.frame_skip = frame_skip  # Simulation ticks per step.
+        self.game = AlienInvasion(headless=True, seed=seed, settings=settings)
+        self.settings = self.game.settings
+        self.dt = 1 / self.settings.tick_rate  # Length of one simulation tick.
+
+        fleet = self.game.fleet
+        self.fleet_size = fleet.number_aliens_x * fleet.number_rows  # Aliens per full fleet.
+        self.observation_size = 5 + self.fleet_size + 2 * self.settings.bullets_allowed
+        self.action_count = len(ACTION_MOVES)
+
+    def reset(self, seed=None):
+        """Start a new game and return the first observation."""
+        if seed is not None:
+            self.game.rng.seed(seed)
+        self.game._start_game()
+        self.game.ship.moving_left = self.game.ship.moving_right = False
+        return self.observe()
+
+    def step(self, action):
+        """Apply action, run frame_skip ticks and return (observation, reward, done, info)."""
+        game = self.game
+        score = game.stats.score
+        game.ship.moving_left, game.ship.moving_right = ACTION_MOVES[action]
+        if action in FIRING_ACTIONS:
+            game._fire_bullet()
+        for _ in range(self.frame_skip):
+            if not game.stats.game_active:
+                break
+            game._step_simulation(self.dt)
+
+        reward = float(game.stats.score - score)
+        done = not game.stats.game_active
+        info = {'score': game.stats.score, 'level': game.stats.level,
+                'ships_left': game.stats.ships_left}
+        return self.observe(), reward, done, info
+
+    def observe(self, out=None):
+        """Write the observation into out (or a new array) and return it."""
+        if out is None:
+            out = np.empty(self.observation_size, dtype=np.float32)
+        game, settings = self.game, self.settings
+        width, height = settings.screen_width, settings.screen_height
+        fleet, bullets = game.fleet, game.bullets
+
+        out[0] = game.ship.x / width
+        if fleet.x.size:
+            out[1] = (fleet.x[0] - fleet.alien_width) / width  # Formation offset.
+            out[2] = (fleet.y[0] - fleet.alien_height) / height
+        else:
+            out[1] = out[2] = 0.0
+        out[3] = settings.fleet_direction
+        out[4] = game.stats.ships_left / settings.ship_limit
+
+        alive = out[5:5 + self.fleet_size]
+        alive[:] = 0.0
+        alive[:fleet.alive.size] = fleet.alive[:self.fleet_size]
+
+        slots = out[5 + self.fleet_size:].reshape(-1, 2)
+        slots[:] = -1.0
+        count = min(len(bullets), len(slots))
+        slots[:count, 0] = bullets.x[:count] / width
+        slots[:count, 1] = bullets.y[:count] / height
+        return out
+
+
+class VectorAlienInvasionEnv:
+    """Class to step several games in parallel, one per worker process.
+
+    Observations are written by the workers straight into a shared-memory
+    array of shape (num_envs, observation_size), so frames are never pickled.
+    The arrays returned by reset() and step() are that shared array and are
+    overwritten by the next call. Finished games are reset automatically;
+    their info still holds the final score, level and ships left.
+    """
+
+    def __init__(self, num_envs, seed=0, frame_skip=4):
+        """Start num_envs worker processes, seeded seed, seed + 1, ..."""
+        self.num_envs = num_envs
+        probe = AlienInvasionEnv(frame_skip=frame_skip)  # Learn the observation size.
+        self.observation_size = probe.observation_size
+        self.action_count = probe.action_count
+        del probe
+
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=num_envs * self.observation_size * 4)
+        self.observations = np.ndarray((num_envs, self.observation_size), dtype=np.float32,
+                                       buffer=self.shm.buf)
+
+        context = multiprocessing.get_context('spawn')  # Each worker gets its own SDL state.
+        self.pipes, self.workers = [], []
+        for index in range(num_envs):
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_worker, daemon=True,
+                args=(child, self.shm.name, index, num_envs, seed + index, frame_skip))
+            worker.start()
+            child.close()
+            self.pipes.append(parent)
+            self.workers.append(worker)
+        for pipe in self.pipes:
+            pipe.recv()  # Wait until every worker is ready.
+
+    def reset(self):
+        """Reset every game and return the batched observations."""
+        for pipe in self.pipes:
+            pipe.send(('reset', None))
+        for pipe in self.pipes:
+            pipe.recv()
+        return self.observations
+
+    def step(self, actions):
+        """Step every game with its action; return (observations, rewards, dones, infos)."""
+        for pipe, action in zip(self.pipes, actions):
+            pipe.send(('step', int(action)))
+        results = [pipe.recv() for pipe in self.pipes]
+        rewards = np.array([result[0] for result in results])
+        dones = np.array([result[1] for result in results])
+        infos = [result[2] for result in results]
+        return self.observations, rewards, dones, infos
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        for pipe in self.pipes:
+            pipe.send(('close', None))
+        for worker in self.workers:
+            worker.join()
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _worker(pipe, shm_name, index, num_envs, seed, frame_skip):
+    """Run one environment, writing its observations into row index of the shared array."""
+    env = AlienInvasionEnv(seed=seed, frame_skip=frame_skip)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    observations = np.ndarray((num_envs, env.observation_size), dtype=np.float32,
+                              buffer=shm.buf)
+    row = observations[index]
+    pipe.send('ready')
+    while True:
+        command, action = pipe.recv()
+        if command == 'reset':
+            row[:] = env.reset()
+            pipe.send(None)
+        elif command == 'step':
+            observation, reward, done, info = env.step(action)
+            if done:  # Start the next game right away.
+                observation = env.reset()
+            row[:] = observation
+            pipe.send((reward, done, info))
+        else:
+            break
+    del observations, row  # Release views before closing the mapping.
+    shm.close()
+
+
+def main():
+    """Measure steps per second for a vector of random players."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--envs', type=int, default=multiprocessing.cpu_count(),
+                        help="number of games stepped in parallel")
+    parser.add_argument('--steps', type=int, default=2000, help="steps per game")
+    args = parser.parse_args()
+
+    vector = VectorAlienInvasionEnv(args.envs)
+    rng = np.random.default_rng(0)
+    vector.reset()
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        vector.step(rng.integers(0, vector.action_count, size=args.envs))
+    elapsed = time.perf_counter() - start
+    vector.close()
+    total = args.envs * args.steps
+    print(f"{args.envs} envs: {total} steps in {elapsed:.2f}s ({total / elapsed:.0f} steps/s)")
+
+
+if __name__ == '__main__':
+    main()
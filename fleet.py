@@ -0,0 +1,162 @@
+import numpy as np  # Import NumPy for array-backed alien positions.
+import pygame  # Import pygame for the fleet's bounding Rect.
+from pygame.sprite import Group  # Import Group to hold the drawable aliens.
+
+from alien import Alien  # Import the Alien sprite used for drawing.
+from geometry import to_pixel, to_pixels  # Import Rect-style rounding helpers.
+
+
+class Fleet:
+    """Class to manage the alien fleet as parallel arrays of positions and alive flags."""
+
+    def __init__(self, ai_game):
+        """Initialize an empty fleet."""
+        self.ai_game = ai_game  # Store the instance of the main game.
+        self.settings = ai_game.settings  # Access the game's settings.
+
+        # The Group only mirrors the living aliens so they can be drawn.
+        self.aliens = Group()
+
+        # Structure-of-arrays storage, one entry per alien in creation order.
+        self.x = np.zeros(0)  # Exact horizontal positions.
+        self.y = np.zeros(0)  # Vertical positions.
+        self.alive = np.zeros(0, dtype=bool)  # Flags for aliens that are still alive.
+        self.sprites = []  # Alien sprites, indexed like the arrays.
+
+        # Size of a single alien, the lattice shape and the running bounding box.
+        self.alien_width = self.alien_height = 0
+        self.number_aliens_x = self.number_rows = 0
+        self.left = self.right = self.top = self.bottom = 0.0
+        self.step = (0.0, 0.0)  # (dx, dy) the fleet moved in its last update.
+
+        self._sprites_dirty = False  # True when sprite rects lag behind the arrays.
+
+    def __len__(self):
+        """Return the number of living aliens."""
+        return len(self.aliens)
+
+    def create(self, number_aliens_x, number_rows):
+        """Lay out a new fleet of number_rows rows with number_aliens_x aliens each."""
+        self.empty()  # Drop any aliens left from the previous fleet.
+        image = self.ai_game.assets.image('alien.bmp')  # Shared alien image.
+        self.alien_width, self.alien_height = image.get_size()  # Size of one alien.
+        self.number_aliens_x, self.number_rows = number_aliens_x, number_rows
+
+        # Place aliens on a lattice spaced two alien widths and heights apart.
+        columns = np.arange(number_aliens_x)
+        rows = np.arange(number_rows)
+        self.x = np.tile(self.alien_width + 2.0 * self.alien_width * columns, number_rows)
+        self.y = np.repeat(self.alien_height + 2.0 * self.alien_height * rows, number_aliens_x)
+        self.alive = np.ones(self.x.size, dtype=bool)
+
+        # Build the sprites once; they only carry the image and rect for drawing.
+        for index in range(self.x.size):
+            alien = Alien(self.ai_game)
+            alien.index = index  # Remember which array slot the sprite mirrors.
+            self.sprites.append(alien)
+        self.aliens.add(self.sprites)
+
+        self._sprites_dirty = True  # Sprite rects still sit at the default position.
+        self._update_bounds()
+
+    def empty(self):
+        """Remove every alien from the fleet."""
+        self.aliens.empty()
+        self.sprites = []
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.number_aliens_x = self.number_rows = 0
+        self.left = self.right = self.top = self.bottom = 0.0
+        self.step = (0.0, 0.0)
+
+    def restore(self, x, y, alive, shape, bounds):
+        """Replace the fleet with saved positions, alive flags, lattice shape and bounding box."""
+        if shape != (self.number_aliens_x, self.number_rows):  # Sprites are reused when they fit.
+            self.create(*shape)
+        self.x, self.y, self.alive = x, y, alive
+        self.aliens.empty()
+        self.aliens.add([alien for alien, living in zip(self.sprites, alive) if living])
+        self.left, self.right, self.top, self.bottom = bounds
+        self.step = (0.0, 0.0)  # Not saved; the next update sets it again.
+        self._sprites_dirty = True
+
+    def kill(self, aliens):
+        """Mark the given alien sprites as dead and shrink the bounding box."""
+        indices = [alien.index for alien in aliens]  # Array slots of the aliens.
+        self.alive[indices] = False  # Clear their alive flags.
+        self.aliens.remove(aliens)  # Stop drawing them.
+        self._update_bounds()  # The living fleet may now be narrower.
+
+    def update(self, dt):
+        """Turn the fleet at the screen edges, then move every alien at once over dt seconds."""
+        if not self.aliens:  # Nothing to move.
+            return
+
+        # The bounding box replaces a per-alien edge check, on whole pixels like the rects.
+        dy = 0.0
+        if (to_pixel(self.right) >= self.settings.screen_width
+                or to_pixel(self.left) <= 0):
+            self._change_direction()
+            dy = float(self.settings.fleet_drop_speed)
+
+        dx = self.settings.alien_speed * dt * self.settings.fleet_direction  # Shared step.
+        self.x += dx  # Move the whole fleet in one array operation.
+        self.left += dx
+        self.right += dx
+        self.step = (dx, dy)  # Swept collisions need the fleet's motion.
+        self._sprites_dirty = True
+
+    def reached_bottom(self):
+        """Return True if any living alien has reached the bottom of the screen."""
+        return bool(self.aliens) and self.bottom >= self.settings.screen_height
+
+    def overlaps(self, rect):
+        """Return True if rect intersects the fleet's bounding box."""
+        return (bool(self.aliens) and rect.right > self.left and rect.left < self.right
+                and rect.bottom > self.top and rect.top < self.bottom)
+
+    def bounds_rect(self):
+        """Return the pixel Rect covering every living alien."""
+        left = to_pixel(self.left)
+        right = to_pixel(self.right - self.alien_width) + self.alien_width
+        top = to_pixel(self.top)
+        bottom = to_pixel(self.bottom - self.alien_height) + self.alien_height
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def column_positions(self):
+        """Return the whole-pixel x of each lattice column."""
+        return to_pixels(self.x[:self.number_aliens_x]).tolist()
+
+    def row_positions(self):
+        """Return the whole-pixel y of each lattice row."""
+        return to_pixels(self.y[::self.number_aliens_x]).tolist()
+
+    def sync_sprites(self):
+        """Copy array positions into the sprite rects before they are drawn or tested."""
+        if not self._sprites_dirty:  # Rects are already current.
+            return
+        for alien in self.aliens:  # Only the living aliens are drawn.
+            alien.rect.x = self.x[alien.index]
+            alien.rect.y = self.y[alien.index]
+        self._sprites_dirty = False
+
+    def _change_direction(self):
+        """Drop the entire fleet and change its direction."""
+        self.y += self.settings.fleet_drop_speed  # Move the fleet down.
+        self.top += self.settings.fleet_drop_speed
+        self.bottom += self.settings.fleet_drop_speed
+        self.settings.fleet_direction *= -1  # Change the direction of the fleet.
+
+    def _update_bounds(self):
+        """Recompute the bounding box of the living aliens."""
+        if not self.alive.any():  # An empty fleet has no extent.
+            self.left = self.right = self.top = self.bottom = 0.0
+            return
+        x = self.x[self.alive]
+        y = self.y[self.alive]
+        self.left = float(x.min())
+        self.right = float(x.max()) + self.alien_width
+        self.top = float(y.min())
+        self.bottom = float(y.max()) + self.alien_height
+
@@ -0,0 +1,51 @@
+from collections import OrderedDict  # Import OrderedDict for the LRU cache.
+
+import pygame  # Import pygame for fonts.
+
+
+class FontService:
+    """Class to share fonts and cache rendered text between the HUD and buttons."""
+
+    def __init__(self, max_cached=64):
+        """Initialize empty font and rendered-string caches."""
+        self.max_cached = max_cached  # Most rendered strings kept at once.
+        self._fonts = {}  # Map of font size to the shared Font.
+        self._strings = OrderedDict()  # LRU cache of rendered strings.
+
+        # Counters for the rendered-string cache.
+        self.hits = 0  # Strings served from the cache.
+        self.misses = 0  # Strings that had to be rendered.
+
+    def font(self, size=48):
+        """Return the shared default font at the given size."""
+        font = self._fonts.get(size)
+        if font is None:  # Open each size only once.
+            font = pygame.font.SysFont(None, size)
+            self._fonts[size] = font
+        return font
+
+    def render(self, text, color, background, size=48):
+        """Return a rendered image of text, reusing recent renders.
+
+        Images are not converted to the display format: a new score is
+        rendered on every kill, and converting would double that cost for the
+        sake of a few small blits per frame.
+        """
+        key = (text, color, background, size)
+        image = self._strings.get(key)
+        if image is not None:
+            self.hits += 1
+            self._strings.move_to_end(key)  # Mark as most recently used.
+            return image
+
+        self.misses += 1
+        image = self.font(size).render(text, True, color, background)
+        self._strings[key] = image
+        if len(self._strings) > self.max_cached:
+            self._strings.popitem(last=False)  # Evict the least recently used.
+        return image
+
+    def stats(self):
+        """Return the rendered-string cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'cached': len(self._strings)}
@@ -0,0 +1,101 @@
+import pygame  # Import pygame for the formation surface.
+
+# Transparent color of the formation surface; it never occurs in the alien image.
+EMPTY_COLOR = (255, 0, 255)
+
+
+class FormationRenderer:
+    """Class to draw the whole alien fleet with one blit of a pre-rendered formation.
+
+    The fleet moves as a rigid lattice, so its aliens are composited once
+    into a surface whose empty cells are transparent. A dead alien's cell is
+    cleared, and the surface is rebuilt when a new fleet is created. When the
+    aliens' own rounding shifts a column or row by a pixel, the image is
+    blitted in per-column or per-row strips rather than recomposited.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize the renderer; there is nothing to draw until rebuild()."""
+        self.ai_game = ai_game  # Store the instance of the main game.
+        self.screen = ai_game.screen  # Get the screen from the game instance.
+        self.fleet = ai_game.fleet  # The fleet whose aliens are drawn.
+
+        self.image = None  # Pre-rendered formation, or None for an empty fleet.
+        self.column_offsets = []  # Pixel x of each lattice column inside the image.
+        self.row_offsets = []  # Pixel y of each lattice row inside the image.
+        self.rebuilds = 0  # Number of times the formation was composited.
+        self.stale = False  # True when the fleet changed and the image must be recomposited.
+
+    def rebuild(self):
+        """Composite the current fleet on the next draw; runs that never draw skip the work."""
+        self.stale = True
+
+    def clear(self, aliens):
+        """Erase the cells of aliens that were shot down."""
+        if self.image is None or self.stale:  # The next layout leaves them out anyway.
+            return
+        fleet = self.fleet
+        for alien in aliens:
+            row, column = divmod(alien.index, fleet.number_aliens_x)  # Lattice cell of the alien.
+            self.image.fill(EMPTY_COLOR, (self.column_offsets[column], self.row_offsets[row],
+                                          fleet.alien_width, fleet.alien_height))
+
+    def draw(self):
+        """Draw every living alien with a single blit."""
+        if not self.fleet.aliens:  # Nothing to draw.
+            return
+        columns = self.fleet.column_positions()  # Where each column lands on screen now.
+        rows = self.fleet.row_positions()
+        if self.stale:
+            self._layout(columns, rows)
+
+        # Aliens round to pixels one by one, so the spacing can drift by a pixel.
+        column_drift = _offsets(columns) != self.column_offsets
+        row_drift = _offsets(rows) != self.row_offsets
+        if not column_drift and not row_drift:
+            self.screen.blit(self.image, (columns[0], rows[0]))
+            return
+
+        # Blit each drifted column or row as its own strip instead of recompositing.
+        width, height = self.image.get_size()
+        if column_drift:
+            x_strips = [(offset, column, self.fleet.alien_width)
+                        for offset, column in zip(self.column_offsets, columns)]
+        else:
+            x_strips = [(0, columns[0], width)]
+        if row_drift:
+            y_strips = [(offset, row, self.fleet.alien_height)
+                        for offset, row in zip(self.row_offsets, rows)]
+        else:
+            y_strips = [(0, rows[0], height)]
+        self.screen.blits([(self.image, (x, y), (left, top, strip_w, strip_h))
+                           for left, x, strip_w in x_strips
+                           for top, y, strip_h in y_strips], doreturn=False)
+
+    def _layout(self, columns, rows):
+        """Build the formation surface for lattice columns and rows at these pixel positions."""
+        fleet = self.fleet
+        self.column_offsets = _offsets(columns)
+        self.row_offsets = _offsets(rows)
+        size = (self.column_offsets[-1] + fleet.alien_width,
+                self.row_offsets[-1] + fleet.alien_height)
+
+        image = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:  # convert() needs a display mode.
+            image = image.convert()  # Match the display pixel format for fast blits.
+        image.fill(EMPTY_COLOR)
+        alien_image = self.ai_game.assets.image('alien.bmp')  # Shared alien image.
+        image.blits([(alien_image, (self.column_offsets[alien.index % fleet.number_aliens_x],
+                                    self.row_offsets[alien.index // fleet.number_aliens_x]))
+                     for alien in fleet.aliens], doreturn=False)
+        # No RLEACCEL: clearing a cell would decode and re-encode the whole surface.
+        image.set_colorkey(EMPTY_COLOR)
+
+        self.image = image
+        self.stale = False
+        self.rebuilds += 1
+
+
+def _offsets(positions):
+    """Return positions relative to the first one."""
+    return [position - positions[0] for position in positions]
@@ -1,3 +1,8 @@
+# States of an active game.
+PLAYING = 'playing'  # The ship, bullets and aliens are moving.
+RESPAWNING = 'respawning'  # Paused after the ship was hit, until the state timer runs out.
+
+
 class GameStats:
     """Class to manage and track game statistics for the Alien Invasion game."""
 
@@ -9,11 +14,14 @@ class GameStats:
         # Set the initial state of the game to inactive.
         self.game_active = False  # Indicates whether the game is currently active.
 
-        # Initialize the high score, which should persist across sessions.
-        self.high_score = 0  # High score starts at zero.
+        # Start from the best stored score, so the high score persists across sessions.
+        leaderboard = ai_game.leaderboard
+        self.high_score = leaderboard.high_score if leaderboard is not None else 0
 
     def reset_stats(self):
         """Set statistics that can change during the course of the game to their initial values."""
         self.ships_left = self.settings.ship_limit  # Set the number of remaining ships to the limit defined in settings.
         self.score = 0  # Reset the player's score to zero.
         self.level = 1  # Start the level at one.
+        self.state = PLAYING  # Current state of an active game.
+        self.state_timer = 0.0  # Seconds left in a timed state.
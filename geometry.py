@@ -0,0 +1,13 @@
+import math  # Import math for pixel rounding.
+
+import numpy as np  # Import NumPy to round whole arrays at once.
+
+
+def to_pixel(value):
+    """Round a coordinate the way a pygame Rect does (halves away from zero)."""
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def to_pixels(values):
+    """Round an array of coordinates like to_pixel and return them as ints."""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values).astype(int)
@@ -0,0 +1,106 @@
+"""Run Alien Invasion games without a display, e.g. for balance tests on CI.
+
+    python headless.py --games 200 --seed 1
+"""
+import argparse  # Import argparse for the command-line options.
+import time  # Import time to report throughput.
+
+import pygame  # Import pygame to build input events.
+
+from alien_invasion import AlienInvasion  # Import the game to simulate.
+from settings import Settings  # Import Settings to turn off the respawn pause.
+
+
+class ScriptedInput:
+    """Controller that feeds a fixed script of (tick, event_type, key) inputs."""
+
+    def __init__(self, script):
+        """Group the scripted inputs by tick."""
+        self.events = {}  # Map of tick to the events sent on that tick.
+        for tick, event_type, key in script:
+            event = pygame.event.Event(event_type, key=key)
+            self.events.setdefault(tick, []).append(event)
+
+    def __call__(self, ai_game, tick):
+        """Return the events scripted for this tick."""
+        return self.events.get(tick, ())
+
+
+class RandomPlayer:
+    """Controller that sweeps the ship at random and fires at a random rate.
+
+    All choices come from the game's seeded generator, so a seed always
+    plays the same game.
+    """
+
+    def __init__(self, turn_every=60, fire_chance=0.05):
+        """Initialize how often the player turns and how often it fires."""
+        self.turn_every = turn_every  # Ticks between direction choices.
+        self.fire_chance = fire_chance  # Chance of firing on any tick.
+        self.key = None  # Arrow key currently held down.
+
+    def __call__(self, ai_game, tick):
+        """Return this tick's key events."""
+        events = []
+        if tick % self.turn_every == 0:  # Pick a new direction.
+            if self.key is not None:
+                events.append(pygame.event.Event(pygame.KEYUP, key=self.key))
+            self.key = ai_game.rng.choice((pygame.K_LEFT, pygame.K_RIGHT))
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=self.key))
+        if ai_game.rng.random() < self.fire_chance:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        return events
+
+
+def play_games(count, seed=0, max_ticks=None, controller_factory=RandomPlayer, settings=None):
+    """Play count headless games and return one result dict per game.
+
+    Game n is seeded with seed + n, so results are reproducible. The pause
+    after losing a ship is skipped. A Settings instance may be passed in,
+    e.g. with a coarser tick_rate and swept_collisions on.
+    """
+    settings = settings or Settings()
+    settings.respawn_time = 0  # Nothing watches the pause, so skip it.
+    ai_game = AlienInvasion(headless=True, settings=settings)  # Reused for every run.
+    results = []
+    for n in range(count):
+        ai_game.rng.seed(seed + n)
+        ai_game.ship.moving_left = ai_game.ship.moving_right = False
+        ticks = ai_game.run_simulation(controller_factory(), max_ticks)
+        results.append({'seed': seed + n, 'ticks': ticks,
+                        'score': ai_game.stats.score, 'level': ai_game.stats.level,
+                        'ships_left': ai_game.stats.ships_left})
+    return results
+
+
+def main():
+    """Play a batch of games and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100, help="number of games to play")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game")
+    parser.add_argument('--max-ticks', type=int, default=None,
+                        help="stop each game after this many simulation steps")
+    parser.add_argument('--tick-rate', type=int, default=None,
+                        help="simulation steps per second (coarser steps play faster)")
+    parser.add_argument('--swept', action='store_true',
+                        help="test each bullet's whole path, so coarse steps keep every hit")
+    args = parser.parse_args()
+
+    settings = Settings()
+    if args.tick_rate:
+        settings.tick_rate = args.tick_rate
+    settings.swept_collisions = args.swept
+
+    start = time.perf_counter()
+    results = play_games(args.games, args.seed, args.max_ticks, settings=settings)
+    elapsed = time.perf_counter() - start
+
+    scores = [result['score'] for result in results]
+    levels = [result['level'] for result in results]
+    print(f"{args.games} games in {elapsed:.2f}s ({args.games / elapsed * 60:.0f} games/min)")
+    print(f"score: mean {sum(scores) / len(scores):.0f}, max {max(scores)}")
+    print(f"level: mean {sum(levels) / len(levels):.2f}, max {max(levels)}")
+
+
+if __name__ == '__main__':
+    main()
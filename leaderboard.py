@@ -0,0 +1,122 @@
+import json  # Import json for the stored leaderboard.
+import os  # Import os for atomic file replacement.
+import threading  # Import threading for the background writer.
+import time  # Import time for timestamps and game ids.
+from contextlib import contextmanager  # Import contextmanager for the file lock.
+
+try:
+    import fcntl  # Import fcntl to serialize writers from several processes.
+except ImportError:  # Windows: writes stay atomic but are not serialized between processes.
+    fcntl = None
+
+
+class Leaderboard:
+    """Class to keep the top scores in a JSON file shared by every game on the machine.
+
+    Scores are recorded in memory and written by a background thread, so a
+    new high score never waits on the disk. Each write takes a lock file,
+    merges the entries already stored by other processes, and atomically
+    replaces the file with the new top entries.
+    """
+
+    def __init__(self, path, size=10, min_interval=0.5):
+        """Load the stored leaderboard and start the background writer."""
+        self.path = path  # JSON file holding the leaderboard.
+        self.size = size  # Number of entries kept.
+        self.min_interval = min_interval  # Seconds between writes, so bursts are coalesced.
+        self.entries = self._read()  # Top entries, best first.
+        self.game_id = None  # Id of the entry for the game being played.
+
+        self._pending = {}  # Entries recorded but not yet written, by id.
+        self._lock = threading.Lock()  # Guards entries and _pending.
+        self._wake = threading.Event()  # Set when there is something to write.
+        self._closing = threading.Event()  # Set when the writer should finish.
+        self._thread = threading.Thread(target=self._run, name='leaderboard-writer',
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def high_score(self):
+        """Return the best stored score, or 0 for an empty leaderboard."""
+        with self._lock:
+            return self.entries[0]['score'] if self.entries else 0
+
+    def new_game(self):
+        """Start a new entry for the next recorded scores."""
+        self.game_id = f"{os.getpid()}-{time.time_ns()}"
+
+    def record(self, score, level):
+        """Record the current game's score and level; the write happens in the background."""
+        if self.game_id is None:
+            self.new_game()
+        entry = {'id': self.game_id, 'score': score, 'level': level,
+                 'timestamp': time.time()}
+        with self._lock:
+            self._pending[entry['id']] = entry
+            self.entries = _top(self.entries + [entry], self.size)
+        self._wake.set()
+
+    def close(self, timeout=2.0):
+        """Write anything still pending and stop the writer thread."""
+        self._closing.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Write pending entries whenever they arrive, at most once per min_interval."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if pending:
+                self._write(list(pending.values()))
+            if self._closing.is_set():
+                if not self._pending:
+                    return
+                continue  # Flush what arrived during the last write.
+            self._closing.wait(self.min_interval)  # Let a burst of scores collect.
+
+    def _write(self, pending):
+        """Merge pending entries with the stored ones and replace the file atomically."""
+        with _file_lock(self.path + '.lock'):
+            top = _top(self._read() + pending, self.size)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as file:
+                json.dump(top, file, indent=2)
+                file.flush()
+                os.fsync(file.fileno())  # Make sure the data is on disk before the swap.
+            os.replace(temp_path, self.path)  # Readers see the old or the new file, never half.
+        with self._lock:
+            self.entries = _top(top + self.entries, self.size)  # Pick up other processes' scores.
+
+    def _read(self):
+        """Return the stored entries, or an empty list if there are none yet."""
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+
+def _top(entries, size):
+    """Return the best size entries, keeping only the best score per game id."""
+    best = {}
+    for entry in entries:
+        kept = best.get(entry['id'])
+        if kept is None or entry['score'] > kept['score']:
+            best[entry['id']] = entry
+    return sorted(best.values(), key=lambda entry: entry['score'], reverse=True)[:size]
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on path while the block runs (where fcntl exists)."""
+    with open(path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,176 @@
+import json  # Import json to stream samples as JSON lines.
+import time  # Import time for the phase timers.
+
+import numpy as np  # Import NumPy for the ring buffer and percentiles.
+import pygame  # Import pygame to draw the overlay.
+
+# Phases timed while profiling, as attribute paths on the game. Times are
+# inclusive: _update_bullets contains _check_bullet_alien_collisions, and
+# _update_screen contains _draw_game (the rest of it is the display push).
+PHASES = ('_check_events', 'ship.update', '_update_bullets',
+          '_check_bullet_alien_collisions', '_update_aliens', 'sb.prep_score',
+          '_draw_game', '_update_screen')
+
+# Top-level phases whose sum is the work done in one frame.
+WORK_PHASES = ('_check_events', 'ship.update', '_update_bullets',
+               '_update_aliens', '_update_screen')
+
+
+class FrameProfiler:
+    """Class to record per-phase frame timings in a fixed-size ring buffer.
+
+    Timing wrappers are only installed while the profiler is enabled, so a
+    disabled profiler costs one attribute check per frame.
+    """
+
+    def __init__(self, ai_game, capacity=600):
+        """Initialize a disabled profiler that keeps the last capacity frames."""
+        self.ai_game = ai_game  # Store the instance of the main game.
+        self.fonts = ai_game.fonts  # Shared fonts for the overlay text.
+        self.enabled = False  # True while timing wrappers are installed.
+        self.overlay_visible = False  # True while the overlay is drawn.
+
+        # Ring buffer of frames: frame time, work time, then one column per phase (ms).
+        self.columns = ('frame_ms', 'work_ms') + PHASES
+        self.samples = np.zeros((capacity, len(self.columns)))
+        self.frames = 0  # Frames recorded since the profiler was enabled.
+        self._current = dict.fromkeys(PHASES, 0.0)  # Phase seconds in the frame being recorded.
+
+        self._wrapped = []  # (owner, attribute) pairs with timing wrappers installed.
+        self._log = None  # Open JSONL file, if samples are being streamed.
+
+        self.overlay_image = None  # Rendered overlay text.
+        self.overlay_rect = pygame.Rect(0, 0, 0, 0)  # Where the overlay is drawn.
+
+    def enable(self, log_path=None):
+        """Start timing phases, optionally streaming samples to a JSONL file."""
+        if self.enabled:
+            return
+        for phase in PHASES:
+            owner_path, _, attribute = phase.rpartition('.')
+            owner = getattr(self.ai_game, owner_path) if owner_path else self.ai_game
+            setattr(owner, attribute, self._timed(getattr(owner, attribute), phase))
+            self._wrapped.append((owner, attribute))
+        if log_path:
+            self._log = open(log_path, 'a')
+        self.frames = 0
+        self.enabled = True
+
+    def disable(self):
+        """Stop timing phases and close the JSONL file."""
+        for owner, attribute in self._wrapped:
+            delattr(owner, attribute)  # Uncover the class's own method again.
+        self._wrapped = []
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.enabled = False
+        self.overlay_visible = False
+
+    def toggle_overlay(self):
+        """Show or hide the overlay, enabling the profiler if needed."""
+        if not self.enabled:
+            self.enable()
+        self.overlay_visible = not self.overlay_visible
+
+    def end_frame(self, frame_time):
+        """Store the frame that just finished; frame_time is in seconds."""
+        phases_ms = [self._current[phase] * 1000 for phase in PHASES]
+        work_ms = sum(self._current[phase] for phase in WORK_PHASES) * 1000
+        row = [frame_time * 1000, work_ms] + phases_ms
+        self.samples[self.frames % len(self.samples)] = row
+        self.frames += 1
+        self.discard_frame()  # Start the next frame from zero.
+
+        if self._log is not None:
+            record = dict(zip(self.columns, row))
+            record['frame'] = self.frames
+            record['aliens'] = len(self.ai_game.aliens)
+            record['bullets'] = len(self.ai_game.bullets)
+            self._log.write(json.dumps(record) + '\n')
+
+        if self.overlay_visible and self.frames % 15 == 1:  # Refresh a few times a second.
+            self._prep_overlay()
+
+    def discard_frame(self):
+        """Drop the phase times recorded since the last end_frame()."""
+        for phase in PHASES:
+            self._current[phase] = 0.0
+
+    def summary(self):
+        """Return FPS, p50/p99 frame and work times, and mean phase times."""
+        recorded = self.samples[:min(self.frames, len(self.samples))]
+        if not len(recorded):
+            return {}
+        frame_ms, work_ms = recorded[:, 0], recorded[:, 1]
+        summary = {
+            'fps': float(1000 / frame_ms.mean()) if frame_ms.mean() else 0.0,
+            'frame_p50_ms': float(np.percentile(frame_ms, 50)),
+            'frame_p99_ms': float(np.percentile(frame_ms, 99)),
+            'work_p50_ms': float(np.percentile(work_ms, 50)),
+            'work_p99_ms': float(np.percentile(work_ms, 99)),
+        }
+        for column, phase in enumerate(PHASES, start=2):
+            summary[phase] = float(recorded[:, column].mean())
+        return summary
+
+    def draw(self):
+        """Draw the overlay, if it is visible."""
+        if self.overlay_visible and self.overlay_image is not None:
+            self.ai_game.screen.blit(self.overlay_image, self.overlay_rect)
+
+    def _timed(self, method, phase):
+        """Return method wrapped to add its run time to the current frame."""
+        current = self._current
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            current[phase] += time.perf_counter() - start
+            return result
+
+        return timed
+
+    def _prep_overlay(self):
+        """Render the overlay text from the latest summary."""
+        summary = self.summary()
+        lines = [
+            f"FPS {summary['fps']:.1f}",
+            f"frame p50 {summary['frame_p50_ms']:.2f} ms  p99 {summary['frame_p99_ms']:.2f} ms",
+            f"work  p50 {summary['work_p50_ms']:.2f} ms  p99 {summary['work_p99_ms']:.2f} ms",
+            f"aliens {len(self.ai_game.aliens)}  bullets {len(self.ai_game.bullets)}",
+        ]
+        font = self.fonts.font(24)
+        images = [font.render(line, True, (255, 255, 255), (0, 0, 0)) for line in lines]
+        width = max(image.get_width() for image in images) + 10
+        height = sum(image.get_height() for image in images) + 10
+
+        self.overlay_image = pygame.Surface((width, height))
+        y = 5
+        for image in images:
+            self.overlay_image.blit(image, (5, y))
+            y += image.get_height()
+        screen_rect = self.ai_game.screen.get_rect()
+        self.overlay_rect = self.overlay_image.get_rect(bottomleft=(10, screen_rect.bottom - 10))
+
+
+class StartupTimer:
+    """Class to record where the time between process start and the first frame goes."""
+
+    def __init__(self, started, imported):
+        """Start timing; started and imported are perf_counter() readings taken by the caller."""
+        self.started = started  # When the game module began importing.
+        self.phases = [('imports', imported - started)]  # (phase, seconds) in the order run.
+        self._last = time.perf_counter()  # End of the previous phase.
+
+    def mark(self, phase):
+        """Record that phase ended now."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self):
+        """Return the phase breakdown and the time to the first frame as text."""
+        lines = [f"{phase:<14}{seconds * 1000:8.1f} ms" for phase, seconds in self.phases]
+        lines.append(f"{'total':<14}{sum(seconds for _, seconds in self.phases) * 1000:8.1f} ms")
+        return '\n'.join(lines)
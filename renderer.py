@@ -0,0 +1,92 @@
+import pygame  # Import the pygame module for drawing and display updates.
+
+
+class DirtyRenderer:
+    """Class to redraw only the screen regions that changed since the last frame.
+
+    Moving things (ship, bullets, the fleet's bounding box) are erased at their
+    previous position every frame. HUD images (score, level, lives, the Play
+    button) are only erased and pushed when their image or position changes.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize the renderer; the first frame is always a full redraw."""
+        self.ai_game = ai_game  # Store the instance of the main game.
+        self.screen = ai_game.screen  # Get the screen from the game instance.
+        self.settings = ai_game.settings  # Access the game's settings.
+
+        self.moving_rects = []  # Regions covered by moving things last frame.
+        self.hud_items = set()  # (image, rect) pairs drawn by the HUD last frame.
+        self.full_redraw = True  # Fill and flip the whole screen on the next frame.
+        self.pushed_pixels = 0  # Pixels sent to the display by the last frame.
+
+    def invalidate(self):
+        """Force the next frame to redraw and push the whole screen."""
+        self.full_redraw = True
+
+    def draw(self):
+        """Draw the current frame and push only the changed regions."""
+        bg_color = self.settings.bg_color
+        moving_rects = self._moving_rects()  # Where moving things are now.
+        hud_items = self._hud_items()  # What the HUD shows now.
+
+        if self.full_redraw:  # First frame or after invalidate().
+            self.screen.fill(bg_color)
+            self.ai_game._draw_game()
+            self._present()
+            self.full_redraw = False
+            self.pushed_pixels = self.screen.get_width() * self.screen.get_height()
+        else:
+            # Erase last frame's moving things and any HUD image that changed.
+            hud_changes = [pygame.Rect(rect) for _, rect in hud_items ^ self.hud_items]
+            erased = self.moving_rects + hud_changes
+            for rect in erased:
+                self.screen.fill(bg_color, rect)
+
+            # Redraw everything; blits outside the pushed regions never reach the display.
+            self.ai_game._draw_game()
+
+            dirty = erased + moving_rects  # Old and new positions both changed.
+            self._present(dirty)
+            self.pushed_pixels = sum(rect.width * rect.height for rect in dirty)
+
+        self.moving_rects = moving_rects
+        self.hud_items = hud_items
+
+    def _present(self, rects=None):
+        """Show the given screen rects, or the whole screen, on the display."""
+        presenter = self.ai_game.presenter  # Set when the screen is scaled to the display.
+        if rects is None:  # Show the whole screen.
+            if presenter is not None:
+                presenter.flip()
+            else:
+                pygame.display.flip()
+        elif presenter is not None:
+            presenter.update(rects)
+        else:
+            pygame.display.update(rects)
+
+    def _moving_rects(self):
+        """Return copies of the rects covered by the ship, bullets and fleet."""
+        rects = [self.ai_game.ship.rect.copy()]
+        rects.extend(self.ai_game.bullets.rects())
+        if self.ai_game.aliens:
+            rects.append(self.ai_game.fleet.bounds_rect())
+        return rects
+
+    def _hud_items(self):
+        """Return the (image, rect) pairs the HUD draws this frame."""
+        sb = self.ai_game.sb
+        items = {
+            (sb.score_image, tuple(sb.score_rect)),
+            (sb.high_score_image, tuple(sb.high_score_rect)),
+            (sb.level_image, tuple(sb.level_rect)),
+        }
+        items.update((sb.ship_image, tuple(rect)) for rect in sb.ship_rects)
+        if not self.ai_game.stats.game_active:  # The Play button is showing.
+            button = self.ai_game.play_button
+            items.add((button.msg_image, tuple(button.rect)))
+        profiler = self.ai_game.profiler
+        if profiler.overlay_visible and profiler.overlay_image is not None:
+            items.add((profiler.overlay_image, tuple(profiler.overlay_rect)))
+        return items
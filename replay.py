@@ -0,0 +1,163 @@
+"""Record the game's input stream and replay it through the game logic.
+
+    python replay.py session.air
+
+A log holds a small header (tick rate, screen size, respawn time), one
+record per input (tick delta as a varint plus a one-byte code) and an end
+record with the final score, level and ships left. Replays run headless as
+fast as the CPU allows and check that they reach the same final state.
+"""
+import argparse  # Import argparse for the command-line options.
+import struct  # Import struct for the binary header and end record.
+import sys  # Import sys for the exit status.
+
+import pygame  # Import pygame to rebuild input events.
+
+from settings import Settings  # Import Settings to match the recorded session.
+
+MAGIC = b'AIR1'  # File signature and format version.
+HEADER = struct.Struct('<HHHH')  # tick_rate, screen_width, screen_height, respawn_time in ms.
+FINAL = struct.Struct('<QHH')  # score, level, ships_left.
+
+# One-byte codes for the recorded inputs.
+KEY_CODES = {
+    (pygame.KEYDOWN, pygame.K_LEFT): 0,
+    (pygame.KEYDOWN, pygame.K_RIGHT): 1,
+    (pygame.KEYDOWN, pygame.K_SPACE): 2,
+    (pygame.KEYUP, pygame.K_LEFT): 3,
+    (pygame.KEYUP, pygame.K_RIGHT): 4,
+    (pygame.KEYUP, pygame.K_SPACE): 5,
+}
+PLAY = 6  # A click on the Play button that started a game.
+END = 255  # Last record, followed by the final state.
+KEY_EVENTS = {code: key_event for key_event, code in KEY_CODES.items()}
+
+
+class InputRecorder:
+    """Class to write the game's input events to a compact binary log."""
+
+    def __init__(self, path, settings):
+        """Open path and write the header for a session with these settings."""
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+        self.file.write(HEADER.pack(settings.tick_rate, settings.screen_width,
+                                    settings.screen_height, round(settings.respawn_time * 1000)))
+        self.last_tick = 0  # Tick of the previous record.
+
+    def record(self, ai_game, tick, event):
+        """Log event if it is one of the inputs that drive the game logic."""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            code = KEY_CODES.get((event.type, event.key))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            starts_game = (not ai_game.stats.game_active
+                           and ai_game.play_button.rect.collidepoint(event.pos))
+            code = PLAY if starts_game else None
+        else:
+            code = None
+        if code is not None:
+            self._write(tick, code)
+
+    def close(self, ai_game, tick):
+        """Write the end record with the final state and close the log."""
+        if self.file.closed:
+            return
+        self._write(tick, END)
+        stats = ai_game.stats
+        self.file.write(FINAL.pack(stats.score, stats.level, stats.ships_left))
+        self.file.close()
+
+    def _write(self, tick, code):
+        """Write one record: the tick delta as a varint, then the code byte."""
+        delta = tick - self.last_tick
+        self.last_tick = tick
+        data = bytearray()
+        while delta >= 0x80:
+            data.append(delta & 0x7F | 0x80)
+            delta >>= 7
+        data.append(delta)
+        data.append(code)
+        self.file.write(data)
+
+
+def read_log(path):
+    """Return (settings, inputs, end_tick, final) read from a log.
+
+    inputs is a list of (tick, code) pairs; final is (score, level, ships_left).
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not an Alien Invasion input log")
+
+    tick_rate, width, height, respawn_ms = HEADER.unpack_from(data, 4)
+    settings = Settings()
+    settings.tick_rate = tick_rate
+    settings.screen_width, settings.screen_height = width, height
+    settings.respawn_time = respawn_ms / 1000
+
+    inputs = []
+    offset = 4 + HEADER.size
+    tick = 0
+    while True:
+        delta, shift = 0, 0
+        while True:  # Decode the varint tick delta.
+            byte = data[offset]
+            offset += 1
+            delta |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        tick += delta
+        code = data[offset]
+        offset += 1
+        if code == END:
+            return settings, inputs, tick, FINAL.unpack_from(data, offset)
+        inputs.append((tick, code))
+
+
+def replay(path):
+    """Replay a log headless and return (ai_game, recorded final state)."""
+    from alien_invasion import AlienInvasion  # Imported here: the game module imports this one.
+
+    settings, inputs, end_tick, final = read_log(path)
+    ai_game = AlienInvasion(headless=True, settings=settings)
+    dt = 1 / settings.tick_rate
+    pending = iter(inputs)
+    next_input = next(pending, None)
+    for tick in range(end_tick):
+        while next_input is not None and next_input[0] == tick:  # Inputs for this tick.
+            ai_game._handle_event(_event_for(ai_game, next_input[1]))
+            next_input = next(pending, None)
+        if ai_game.stats.game_active:
+            ai_game._step_simulation(dt)
+    return ai_game, final
+
+
+def _event_for(ai_game, code):
+    """Return the pygame event that a record code stands for."""
+    if code == PLAY:
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=ai_game.play_button.rect.center,
+                                  button=1)
+    event_type, key = KEY_EVENTS[code]
+    return pygame.event.Event(event_type, key=key)
+
+
+def main():
+    """Replay a log and report whether it reached the recorded final state."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('log', help="input log written with Settings.record_path")
+    args = parser.parse_args()
+
+    ai_game, final = replay(args.log)
+    stats = ai_game.stats
+    replayed = (stats.score, stats.level, stats.ships_left)
+    print(f"recorded: score {final[0]}, level {final[1]}, ships left {final[2]}")
+    print(f"replayed: score {replayed[0]}, level {replayed[1]}, ships left {replayed[2]}")
+    if replayed != tuple(final):
+        print("MISMATCH")
+        sys.exit(1)
+    print("match")
+
+
+if __name__ == '__main__':
+    main()
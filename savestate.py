@@ -0,0 +1,161 @@
+"""Save and restore the whole game state as compact binary snapshots.
+
+A snapshot holds the dynamic settings, the statistics, the ship, the
+bullets and the fleet, exactly enough for the game to continue as if it
+had never stopped. The seeded generator is not included: reseed it after
+restoring to branch several runs from one state.
+"""
+import struct  # Import struct for the fixed-size part of a snapshot.
+import zlib  # Import zlib to compress deltas between keyframes.
+from collections import deque  # Import deque for the rewind ring.
+
+import numpy as np  # Import NumPy for the array parts of a snapshot.
+
+from game_stats import PLAYING, RESPAWNING  # Import the states of an active game.
+
+MAGIC = b'AIS1'  # Snapshot signature and format version.
+
+# Ship, bullet and alien speed, fleet direction, alien points; score, high score,
+# level, ships left, state, state timer, game active; ship x, moving left, moving right;
+# aliens per row, rows, bullets; fleet left, right, top, bottom.
+STATE = struct.Struct('<4s dddbI QQHBBd? d?? HHH dddd')
+STATES = (PLAYING, RESPAWNING)  # Stored as their index.
+
+
+def snapshot(ai_game):
+    """Return the game's current state as bytes."""
+    settings, stats, ship = ai_game.settings, ai_game.stats, ai_game.ship
+    fleet, bullets = ai_game.fleet, ai_game.bullets
+    count = len(bullets)
+    head = STATE.pack(
+        MAGIC,
+        settings.ship_speed, settings.bullet_speed, settings.alien_speed,
+        settings.fleet_direction, settings.alien_points,
+        stats.score, stats.high_score, stats.level, stats.ships_left,
+        STATES.index(stats.state), stats.state_timer, stats.game_active,
+        ship.x, ship.moving_left, ship.moving_right,
+        fleet.number_aliens_x, fleet.number_rows, count,
+        fleet.left, fleet.right, fleet.top, fleet.bottom)
+    # Fixed-size arrays first, so consecutive snapshots line up for delta encoding.
+    return b''.join((head, fleet.x.astype('<f8').tobytes(), fleet.y.astype('<f8').tobytes(),
+                     np.packbits(fleet.alive).tobytes(),
+                     bullets.x[:count].astype('<i4').tobytes(),
+                     bullets.y[:count].astype('<f8').tobytes()))
+
+
+def restore(ai_game, data):
+    """Put the game back into the state saved in data."""
+    (magic, ship_speed, bullet_speed, alien_speed, fleet_direction, alien_points,
+     score, high_score, level, ships_left, state, state_timer, game_active,
+     ship_x, moving_left, moving_right, number_aliens_x, number_rows, count,
+     left, right, top, bottom) = STATE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not an Alien Invasion snapshot")
+
+    settings, stats, ship = ai_game.settings, ai_game.stats, ai_game.ship
+    settings.ship_speed, settings.bullet_speed = ship_speed, bullet_speed
+    settings.alien_speed, settings.fleet_direction = alien_speed, fleet_direction
+    settings.alien_points = alien_points
+    stats.score, stats.high_score, stats.level = score, high_score, level
+    stats.ships_left, stats.state, stats.state_timer = ships_left, STATES[state], state_timer
+    stats.game_active = game_active
+    ship.x, ship.moving_left, ship.moving_right = ship_x, moving_left, moving_right
+    ship.rect.x = ship.x
+
+    offset = STATE.size
+    size = number_aliens_x * number_rows
+    x = np.frombuffer(data, '<f8', size, offset).astype(float)
+    offset += size * 8
+    y = np.frombuffer(data, '<f8', size, offset).astype(float)
+    offset += size * 8
+    alive = np.unpackbits(np.frombuffer(data, np.uint8, (size + 7) // 8, offset),
+                          count=size).astype(bool)
+    offset += (size + 7) // 8
+    ai_game.fleet.restore(x, y, alive, (number_aliens_x, number_rows),
+                          (left, right, top, bottom))
+    bullet_x = np.frombuffer(data, '<i4', count, offset)
+    bullet_y = np.frombuffer(data, '<f8', count, offset + count * 4)
+    ai_game.bullets.restore(bullet_x, bullet_y)
+
+    # Refresh everything derived from the restored state.
+    ai_game.formation.rebuild()
+    ai_game.sb.prep_score()
+    ai_game.sb.prep_high_score()
+    ai_game.sb.prep_level()
+    ai_game.sb.prep_ships()
+    ai_game.renderer.invalidate()
+
+
+class RewindBuffer:
+    """Class to keep recent snapshots in a memory-bounded ring for instant rewind.
+
+    Every keyframe_interval-th snapshot is stored whole. The ones in between
+    are stored as the zlib-compressed XOR against their keyframe, which is
+    mostly zeros. When the ring outgrows max_bytes, the oldest keyframe and
+    its deltas are dropped together.
+    """
+
+    def __init__(self, max_bytes=1 << 20, keyframe_interval=30):
+        """Initialize an empty ring that holds at most max_bytes of snapshots."""
+        self.max_bytes = max_bytes  # Memory budget for stored snapshots.
+        self.keyframe_interval = keyframe_interval  # Snapshots per keyframe group.
+        self.groups = deque()  # [keyframe, [deltas]] groups, oldest first.
+        self.size = 0  # Bytes currently stored.
+
+    def __len__(self):
+        """Return the number of snapshots that can be rewound to."""
+        return sum(1 + len(deltas) for _, deltas in self.groups)
+
+    def push(self, data):
+        """Store a snapshot as the newest entry."""
+        if not self.groups or len(self.groups[-1][1]) + 1 >= self.keyframe_interval:
+            self.groups.append((data, []))
+            self.size += len(data)
+        else:
+            keyframe, deltas = self.groups[-1]
+            delta = zlib.compress(_xor(data, keyframe), 1)
+            deltas.append(delta)
+            self.size += len(delta)
+        while self.size > self.max_bytes and len(self.groups) > 1:  # Keep the newest group.
+            keyframe, deltas = self.groups.popleft()
+            self.size -= len(keyframe) + sum(len(delta) for delta in deltas)
+
+    def rewind(self, steps=1):
+        """Drop the newest steps snapshots and return the one before them (or None)."""
+        for _ in range(steps):
+            self._pop()
+        return self.latest()
+
+    def latest(self):
+        """Return the newest snapshot, or None if the ring is empty."""
+        if not self.groups:
+            return None
+        keyframe, deltas = self.groups[-1]
+        if not deltas:
+            return keyframe
+        return _xor(zlib.decompress(deltas[-1]), keyframe)
+
+    def clear(self):
+        """Drop every snapshot."""
+        self.groups.clear()
+        self.size = 0
+
+    def _pop(self):
+        """Drop the newest snapshot."""
+        if not self.groups:
+            return
+        keyframe, deltas = self.groups[-1]
+        if deltas:
+            self.size -= len(deltas.pop())
+        else:
+            self.groups.pop()
+            self.size -= len(keyframe)
+
+
+def _xor(data, reference):
+    """Return data XOR reference, with reference cut or zero-padded to data's length."""
+    values = np.frombuffer(data, np.uint8)
+    base = np.zeros(len(data), np.uint8)
+    common = min(len(data), len(reference))
+    base[:common] = np.frombuffer(reference, np.uint8, common)
+    return (values ^ base).tobytes()
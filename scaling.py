@@ -0,0 +1,78 @@
+import pygame  # Import pygame for scaling and display updates.
+
+
+class ScaledPresenter:
+    """Class to show a fixed-size logical screen scaled to fit the real display.
+
+    The game draws into a surface of the logical size from Settings, so its
+    pixel work and fleet layout are the same on every machine. Each frame is
+    scaled to the display in one step. Integer scaling keeps pixels sharp
+    and maps dirty regions exactly. Smooth scaling fills more of the display
+    but always rescales the whole frame.
+    """
+
+    def __init__(self, window, logical_size, mode='integer'):
+        """Initialize scaling of a logical_size screen into the window surface."""
+        self.window = window  # The real display surface.
+        self.mode = mode  # 'integer' or 'smooth'.
+        self.screen = pygame.Surface(logical_size).convert()  # Surface the game draws into.
+
+        # Largest scale that fits; integer mode falls back to smooth when the display is too small.
+        width, height = logical_size
+        window_rect = window.get_rect()
+        self.scale = min(window_rect.width / width, window_rect.height / height)
+        if mode == 'integer' and self.scale >= 1:
+            self.scale = int(self.scale)
+        else:
+            self.mode = 'smooth'
+        self.target = pygame.Rect(0, 0, round(width * self.scale), round(height * self.scale))
+        self.target.center = window_rect.center  # Letterbox the scaled frame.
+        self._target_surface = window.subsurface(self.target)  # Scaled frames are written here.
+        self.full_present = True  # Paint the bars and push the whole window with the next frame.
+
+    def invalidate(self):
+        """Repaint the black bars and push the whole window with the next frame."""
+        self.full_present = True
+
+    def flip(self):
+        """Scale the whole logical screen to the display and show it."""
+        if self.full_present:
+            self.window.fill((0, 0, 0))  # Black bars around the scaled frame.
+        if self.mode == 'integer':
+            pygame.transform.scale(self.screen, self.target.size, self._target_surface)
+        else:
+            pygame.transform.smoothscale(self.screen, self.target.size, self._target_surface)
+        if self.full_present:
+            pygame.display.flip()
+            self.full_present = False
+        else:
+            pygame.display.update(self.target)
+
+    def update(self, rects):
+        """Scale and show only the logical rects that changed."""
+        # Smoothed edges would show seams between regions, and a full present covers them all.
+        if self.mode != 'integer' or self.full_present:
+            self.flip()
+            return
+        screen_rect = self.screen.get_rect()
+        scale = self.scale
+        updated = []
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if not rect.width or not rect.height:  # Nothing on screen.
+                continue
+            dest = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale,
+                               rect.height * scale)
+            pygame.transform.scale(self.screen.subsurface(rect), dest.size,
+                                   self._target_surface.subsurface(dest))
+            updated.append(dest.move(self.target.topleft))
+        pygame.display.update(updated)
+
+    def to_logical(self, event):
+        """Return event with its mouse position mapped to logical screen coordinates."""
+        if not hasattr(event, 'pos'):
+            return event
+        x = int((event.pos[0] - self.target.x) // self.scale)
+        y = int((event.pos[1] - self.target.y) // self.scale)
+        attributes = dict(event.dict, pos=(x, y))
+        return pygame.event.Event(event.type, attributes)
@@ -1,7 +1,4 @@
-import pygame.font  # Import the font module from Pygame.
-from pygame.sprite import Group  # Import Group to manage multiple sprites.
-
-from ship import Ship  # Import the Ship class from the ship module.
+import pygame  # Import Pygame for the Rects of the ships display.
 
 
 class Scoreboard:
@@ -17,7 +14,8 @@ class Scoreboard:
 
         # Set font color for the score display.
         self.text_color = (30, 30, 30)  # Define the color for the text.
-        self.font = pygame.font.SysFont(None, 48)  # Set the font style and size.
+        self.fonts = ai_game.fonts  # Shared fonts and rendered text caches.
+        self.ship_image = ai_game.assets.image('ship.bmp')  # One cached icon for every life.
 
         # Prepare images for the initial score display.
         self.prep_score()  # Prepare the score image.
@@ -29,7 +27,7 @@ class Scoreboard:
         """Convert the score to a rendered image for display."""
         rounded_score = round(self.stats.score, -1)  # Round the score to the nearest ten.
         score_str = "{:,}".format(rounded_score)  # Format the score with commas.
-        self.score_image = self.font.render(score_str, True,  # Render the score as an image.
+        self.score_image = self.fonts.render(score_str,  # Render the score, or reuse a cached image.
                                              self.text_color, self.settings.bg_color)
 
         # Position the score image at the top-right corner.
@@ -41,7 +39,7 @@ class Scoreboard:
         """Convert the high score to a rendered image for display."""
         high_score = round(self.stats.high_score, -1)  # Round the high score.
         high_score_str = "{:,}".format(high_score)  # Format the high score with commas.
-        self.high_score_image = self.font.render(high_score_str, True,  # Render the high score image.
+        self.high_score_image = self.fonts.render(high_score_str,  # Render the high score image.
                                                   self.text_color, self.settings.bg_color)
 
         # Center the high score at the top of the screen.
@@ -52,7 +50,7 @@ class Scoreboard:
     def prep_level(self):
         """Convert the current level to a rendered image for display."""
         level_str = str(self.stats.level)  # Convert the level number to a string.
-        self.level_image = self.font.render(level_str, True,  # Render the level image.
+        self.level_image = self.fonts.render(level_str,  # Render the level image.
                                              self.text_color, self.settings.bg_color)
 
         # Position the level display below the score.
@@ -62,22 +60,22 @@ class Scoreboard:
 
     def prep_ships(self):
         """Display the number of remaining ships."""
-        self.ships = Group()  # Create a group to hold ship sprites.
-        for ship_number in range(self.stats.ships_left):  # Loop through the number of remaining ships.
-            ship = Ship(self.ai_game)  # Create a new ship instance.
-            ship.rect.x = 10 + ship_number * ship.rect.width  # Position ships horizontally.
-            ship.rect.y = 10  # Set the vertical position.
-            self.ships.add(ship)  # Add the ship to the group.
+        width, height = self.ship_image.get_size()  # Size of one ship icon.
+        self.ship_rects = [pygame.Rect(10 + ship_number * width, 10, width, height)  # Position ships horizontally.
+                           for ship_number in range(self.stats.ships_left)]
 
     def check_high_score(self):
         """Check if the current score is a new high score."""
         if self.stats.score > self.stats.high_score:  # Compare current score with high score.
             self.stats.high_score = self.stats.score  # Update the high score if needed.
             self.prep_high_score()  # Prepare the new high score image.
+            if self.ai_game.leaderboard is not None:  # Store it; the write happens in the background.
+                self.ai_game.leaderboard.record(self.stats.score, self.stats.level)
 
     def show_score(self):
         """Render the score, level, and ships on the screen."""
         self.screen.blit(self.score_image, self.score_rect)  # Draw the score image.
         self.screen.blit(self.high_score_image, self.high_score_rect)  # Draw the high score image.
         self.screen.blit(self.level_image, self.level_rect)  # Draw the level image.
-        self.ships.draw(self.screen)  # Draw the remaining ships on the screen.
+        self.screen.blits([(self.ship_image, rect) for rect in self.ship_rects],  # Draw the remaining ships.
+                          doreturn=False)
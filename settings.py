@@ -7,9 +7,14 @@ class Settings:
         self.screen_width = 1200  # Width of the game window.
         self.screen_height = 800  # Height of the game window.
         self.bg_color = (230, 230, 230)  # Background color of the game.
+        self.logical_resolution = False  # Keep the size above on any display and scale the frames to fit.
+        self.scale_mode = 'integer'  # 'integer' for sharp whole-number scaling, 'smooth' to fill the display.
+        self.asset_bundle = 'images.zip'  # Packed images, read before the loose files; None turns it off.
+        self.dirty_rendering = False  # Push only changed regions instead of flipping the whole screen.
 
         # Ship settings
         self.ship_limit = 3  # Maximum number of ships a player can have.
+        self.respawn_time = 0.5  # Seconds the game pauses after the ship is hit; 0 skips the pause.
 
         # Bullet settings
         self.bullet_width = 3  # Width of the bullets.
@@ -20,6 +25,33 @@ class Settings:
         # Alien settings
         self.fleet_drop_speed = 10  # Speed at which aliens drop down the screen.
 
+        # Timing settings
+        self.tick_rate = 120  # Simulation steps per second.
+        self.fps_cap = 60  # Maximum rendered frames per second; 0 renders as fast as possible.
+        self.max_frame_time = 0.25  # Longest frame, in seconds, the simulation catches up on.
+        self.swept_collisions = False  # Test each bullet's whole path, so long steps can't skip hits.
+        self.idle_timeout = 0.5  # Longest wait, in seconds, for input while no game is running.
+
+        # Profiling settings
+        self.profiling = False  # Record per-phase frame timings from the start.
+        self.profile_log = None  # JSONL file that receives every frame sample, if set.
+        self.startup_report = False  # Print where the time to the first frame went.
+
+        # Leaderboard settings
+        self.leaderboard_path = 'leaderboard.json'  # File shared by every game on the machine; None turns it off.
+        self.leaderboard_size = 10  # Number of top scores kept.
+
+        # Input recording settings
+        self.record_path = None  # Binary log that records the session's input, if set.
+
+        # Spectator settings
+        self.telemetry_address = None  # (host, port) of a dashboard that mirrors the game, if set.
+        self.telemetry_keyframe_interval = 120  # Ticks between full states in the stream.
+
+        # Rewind settings
+        self.rewind_memory = 0  # Bytes of recent snapshots Backspace can rewind through; 0 turns it off.
+        self.rewind_interval = 6  # Ticks between snapshots.
+
         # Speed-up settings
         self.speedup_scale = 1.1  # Scale factor for increasing game speed.
         self.score_scale = 1.5  # Scale factor for increasing alien score values.
@@ -29,9 +61,9 @@ class Settings:
 
     def initialize_dynamic_settings(self):
         """Set up the settings that will change throughout the gameplay."""
-        self.ship_speed = 1.5  # Speed of the player's ship.
-        self.bullet_speed = 3.0  # Speed of the bullets.
-        self.alien_speed = 1.0  # Speed of the aliens.
+        self.ship_speed = 180.0  # Speed of the player's ship, in pixels per second.
+        self.bullet_speed = 360.0  # Speed of the bullets, in pixels per second.
+        self.alien_speed = 120.0  # Speed of the aliens, in pixels per second.
 
         # Direction of the alien fleet: 1 means moving right, -1 means moving left.
         self.fleet_direction = 1  
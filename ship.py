@@ -1,4 +1,3 @@
-import pygame
 from pygame.sprite import Sprite
 
 
@@ -12,8 +11,8 @@ class Ship(Sprite):
         self.settings = ai_game.settings  # Reference to game settings.
         self.screen_rect = ai_game.screen.get_rect()  # Get the dimensions of the screen.
 
-        # Load the ship image and create a rect object for it.
-        self.image = pygame.image.load('images/ship.bmp')  # Load the ship's image.
+        # Use the shared ship image and create a rect object for it.
+        self.image = ai_game.assets.image('ship.bmp')  # Get the cached ship image.
         self.rect = self.image.get_rect()  # Create a rect object for positioning.
 
         # Position the ship at the center bottom of the screen.
@@ -26,13 +25,14 @@ class Ship(Sprite):
         self.moving_right = False  # Flag for moving right.
         self.moving_left = False  # Flag for moving left.
 
-    def update(self):
-        """Update the ship's position based on movement flags."""
+    def update(self, dt):
+        """Update the ship's position based on movement flags over dt seconds."""
+        step = self.settings.ship_speed * dt  # Distance covered during this step.
         # Adjust the ship's x-coordinate if movement is flagged.
         if self.moving_right and self.rect.right < self.screen_rect.right:  # Move right if within screen bounds.
-            self.x += self.settings.ship_speed  # Increase x position by ship speed.
+            self.x += step  # Increase x position by the step.
         if self.moving_left and self.rect.left > 0:  # Move left if within screen bounds.
-            self.x -= self.settings.ship_speed  # Decrease x position by ship speed.
+            self.x -= step  # Decrease x position by the step.
 
         # Update the rect position based on the float x value.
         self.rect.x = self.x  # Apply updated x position to the rect object.
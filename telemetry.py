@@ -0,0 +1,230 @@
+"""Stream running games to a spectator dashboard on the same host.
+
+    python telemetry.py --port 47000
+
+Each game started with Settings.telemetry_address sends one UDP datagram
+per simulation tick. A keyframe holds the whole state; the ticks between
+keyframes send only what changed since the previous tick. The fleet goes
+out as an alive bitmask plus the formation's offset, and deltas list the
+aliens that died. A dashboard that misses a datagram waits for the next
+keyframe. Sending never blocks the game; nothing is sent back to it.
+"""
+import argparse  # Import argparse for the command-line options.
+import os  # Import os for the game id.
+import socket  # Import socket for the UDP stream.
+import struct  # Import struct for the binary records.
+import time  # Import time to pace the dashboard's output.
+
+import numpy as np  # Import NumPy for the fleet bitmask.
+
+from game_stats import RESPAWNING  # Import the state reported as respawning.
+from geometry import to_pixel  # Import Rect-style rounding for the formation offset.
+
+MAGIC = b'AIT1'  # Datagram signature and format version.
+HEADER = struct.Struct('<4sIIB')  # magic, game id, tick, kind.
+KEYFRAME, DELTA = 0, 1  # Kinds of datagram.
+
+# Field flags of a delta; a keyframe always carries every field.
+SHIP, FORMATION, FLEET, BULLETS, STATS = 1, 2, 4, 8, 16
+
+SHIP_RECORD = struct.Struct('<h')  # ship x.
+FORMATION_RECORD = struct.Struct('<hh')  # Pixel position of the first lattice cell.
+SHAPE_RECORD = struct.Struct('<HH')  # Aliens per row, number of rows.
+STATS_RECORD = struct.Struct('<QQHBB')  # score, high score, level, ships left, flags.
+ACTIVE, RESPAWN = 1, 2  # Flags in the stats record.
+COUNT = struct.Struct('<H')  # Length of a bullet or dead-alien list.
+POINT = struct.Struct('<hh')  # One bullet's x, y.
+INDEX = struct.Struct('<H')  # One dead alien's index.
+
+
+class TelemetryStream:
+    """Class to send a game's state to a spectator dashboard, delta-encoded per tick."""
+
+    def __init__(self, ai_game, address, keyframe_interval=120):
+        """Initialize a stream to the (host, port) address; every keyframe_interval ticks is a keyframe."""
+        self.ai_game = ai_game  # Store the instance of the main game.
+        self.address = tuple(address)  # Where the dashboard listens.
+        self.keyframe_interval = keyframe_interval  # Ticks between full states.
+        self.game_id = os.getpid()  # Tells games apart on a shared dashboard.
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)  # Drop datagrams rather than wait.
+        self.previous = None  # State sent on the last tick.
+        self.bytes_sent = 0  # Total payload, for measuring the stream's cost.
+
+    def send(self, tick):
+        """Send this tick's state: a keyframe, or the fields that changed."""
+        state = self._capture()
+        previous = self.previous
+        if (previous is None or tick % self.keyframe_interval == 0
+                or state['shape'] != previous['shape']
+                or (state['alive'] & ~previous['alive']).any()):  # A new fleet brings aliens back.
+            packet = encode_keyframe(self.game_id, tick, state)
+        else:
+            packet = encode_delta(self.game_id, tick, previous, state)
+        self.previous = state
+        try:
+            self.socket.sendto(packet, self.address)
+        except (BlockingIOError, ConnectionRefusedError):  # No room or no dashboard: skip it.
+            return
+        self.bytes_sent += len(packet)
+
+    def close(self):
+        """Close the socket."""
+        self.socket.close()
+
+    def _capture(self):
+        """Return the state the stream carries."""
+        ai_game = self.ai_game
+        fleet, stats = ai_game.fleet, ai_game.stats
+        xs, ys = ai_game.bullets.positions()
+        if fleet.x.size:  # The formation moves as one, so its first cell locates every alien.
+            formation = (to_pixel(fleet.x[0]), to_pixel(fleet.y[0]))
+        else:
+            formation = (0, 0)
+        flags = (ACTIVE if stats.game_active else 0) | (RESPAWN if stats.state == RESPAWNING else 0)
+        return {
+            'ship': ai_game.ship.rect.x,
+            'formation': formation,
+            'shape': (fleet.number_aliens_x, fleet.number_rows),
+            'alive': fleet.alive.copy(),
+            'bullets': list(zip(xs, ys)),
+            'stats': (stats.score, stats.high_score, stats.level, stats.ships_left, flags),
+        }
+
+
+def encode_keyframe(game_id, tick, state):
+    """Return a keyframe datagram holding the whole state."""
+    parts = [HEADER.pack(MAGIC, game_id, tick, KEYFRAME),
+             SHIP_RECORD.pack(state['ship']),
+             FORMATION_RECORD.pack(*state['formation']),
+             SHAPE_RECORD.pack(*state['shape']),
+             np.packbits(state['alive']).tobytes(),
+             _pack_bullets(state['bullets']),
+             STATS_RECORD.pack(*state['stats'])]
+    return b''.join(parts)
+
+
+def encode_delta(game_id, tick, previous, state):
+    """Return a delta datagram with the fields that changed since previous."""
+    fields = 0
+    parts = []
+    if state['ship'] != previous['ship']:
+        fields |= SHIP
+        parts.append(SHIP_RECORD.pack(state['ship']))
+    if state['formation'] != previous['formation']:
+        fields |= FORMATION
+        parts.append(FORMATION_RECORD.pack(*state['formation']))
+    dead = np.flatnonzero(previous['alive'] & ~state['alive'])  # Aliens only die between keyframes.
+    if dead.size:
+        fields |= FLEET
+        parts.append(COUNT.pack(dead.size) + dead.astype('<u2').tobytes())
+    if state['bullets'] != previous['bullets']:
+        fields |= BULLETS
+        parts.append(_pack_bullets(state['bullets']))
+    if state['stats'] != previous['stats']:
+        fields |= STATS
+        parts.append(STATS_RECORD.pack(*state['stats']))
+    return HEADER.pack(MAGIC, game_id, tick, DELTA) + bytes([fields]) + b''.join(parts)
+
+
+def decode(packet, views):
+    """Apply a datagram to views, a dict of game id to state; return the game id or None.
+
+    A delta is only applied on top of the tick right before it, so a view
+    that missed a datagram stays stale until the next keyframe.
+    """
+    magic, game_id, tick, kind = HEADER.unpack_from(packet)
+    if magic != MAGIC:
+        return None
+    offset = HEADER.size
+    if kind == KEYFRAME:
+        state = {}
+        state['ship'], = SHIP_RECORD.unpack_from(packet, offset)
+        offset += SHIP_RECORD.size
+        state['formation'] = FORMATION_RECORD.unpack_from(packet, offset)
+        offset += FORMATION_RECORD.size
+        state['shape'] = SHAPE_RECORD.unpack_from(packet, offset)
+        offset += SHAPE_RECORD.size
+        count = state['shape'][0] * state['shape'][1]
+        mask_size = (count + 7) // 8
+        mask = np.frombuffer(packet, np.uint8, mask_size, offset)
+        state['alive'] = np.unpackbits(mask, count=count).astype(bool)
+        offset += mask_size
+        state['bullets'], offset = _unpack_bullets(packet, offset)
+        state['stats'] = STATS_RECORD.unpack_from(packet, offset)
+    else:
+        state = views.get(game_id)
+        if state is None or state['tick'] != tick - 1:  # Missed a datagram.
+            return None
+        state = dict(state, alive=state['alive'].copy())
+        fields = packet[offset]
+        offset += 1
+        if fields & SHIP:
+            state['ship'], = SHIP_RECORD.unpack_from(packet, offset)
+            offset += SHIP_RECORD.size
+        if fields & FORMATION:
+            state['formation'] = FORMATION_RECORD.unpack_from(packet, offset)
+            offset += FORMATION_RECORD.size
+        if fields & FLEET:
+            count, = COUNT.unpack_from(packet, offset)
+            offset += COUNT.size
+            state['alive'][np.frombuffer(packet, '<u2', count, offset)] = False
+            offset += count * INDEX.size
+        if fields & BULLETS:
+            state['bullets'], offset = _unpack_bullets(packet, offset)
+        if fields & STATS:
+            state['stats'] = STATS_RECORD.unpack_from(packet, offset)
+    state['tick'] = tick
+    views[game_id] = state
+    return game_id
+
+
+def _pack_bullets(bullets):
+    """Return the bullet list as a count and (x, y) pairs."""
+    return COUNT.pack(len(bullets)) + b''.join(POINT.pack(x, y) for x, y in bullets)
+
+
+def _unpack_bullets(packet, offset):
+    """Return (bullets, offset after them) read from packet at offset."""
+    count, = COUNT.unpack_from(packet, offset)
+    offset += COUNT.size
+    bullets = [POINT.unpack_from(packet, offset + n * POINT.size) for n in range(count)]
+    return bullets, offset + count * POINT.size
+
+
+def main():
+    """Listen for games and print a line per game once a second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=47000, help="UDP port to listen on")
+    args = parser.parse_args()
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind((args.host, args.port))
+    listener.settimeout(0.1)
+    views = {}
+    received = 0  # Bytes received since the last report.
+    next_report = time.monotonic() + 1
+    while True:
+        try:
+            packet = listener.recv(65536)
+        except socket.timeout:
+            packet = None
+        if packet:
+            received += len(packet)
+            decode(packet, views)
+        if time.monotonic() >= next_report:
+            print(f"{len(views)} games, {received / 1024:.1f} KiB/s")
+            for game_id, state in sorted(views.items()):
+                score, high_score, level, ships_left, flags = state['stats']
+                status = 'playing' if flags & ACTIVE else 'idle'
+                print(f"  {game_id:>10}  tick {state['tick']:>8}  score {score:>8}  "
+                      f"level {level:>3}  ships {ships_left}  aliens {int(state['alive'].sum()):>3}  "
+                      f"bullets {len(state['bullets'])}  {status}")
+            received = 0
+            next_report += 1
+
+
+if __name__ == '__main__':
+    main()